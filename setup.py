@@ -86,6 +86,24 @@ def initialize_database():
     return True
 
 
+def install_duckdb_extensions():
+    """Install DuckDB's sqlite extension, used by the optional analytics engine."""
+    try:
+        import duckdb
+    except ImportError:
+        print("ℹ️  duckdb not installed - analytics queries will use SQLite")
+        return True
+    
+    print("Installing DuckDB sqlite extension...")
+    try:
+        duckdb.execute("INSTALL sqlite")
+        print("✅ DuckDB sqlite extension installed")
+    except Exception as e:
+        print(f"⚠️  Could not install DuckDB sqlite extension: {str(e)}")
+        print("   Analytics queries will use SQLite instead")
+    return True
+
+
 def run_test():
     """Run a basic test to ensure everything works."""
     print("Running basic test...")
@@ -119,7 +137,10 @@ def main():
     if not initialize_database():
         success = False
     
-    # Step 5: Run basic test
+    # Step 5: Install optional analytics extensions
+    install_duckdb_extensions()
+    
+    # Step 6: Run basic test
     if not run_test():
         success = False
     
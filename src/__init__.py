@@ -13,26 +13,73 @@ Package Structure:
 - visualization/: Chart and graph generation
 """
 
-# Import main classes for convenience
-from .api import (
-    RentCastClient, BaseHTTPClient, HTTPClientError,
-    RentCastAPIError, RentCastInvalidParametersError, RentCastAuthError,
-    RentCastNoResultsError, RentCastRateLimitError, RentCastServerError,
-    RentCastTimeoutError, get_error_recommendation
-)
-from .core import (
-    RealEstateAnalyzer, RealEstateDataFetcher, DatabaseManager,
-    PaginationManager, APIResponse, PaginationParams, PaginatedResult
-)
-from .search import (
-    SearchCriteria, SearchType, PropertyType,
-    SpecificAddressSearch, LocationSearch, GeographicalAreaSearch,
-    SearchQueryBuilder, search_by_address, search_by_location,
-    search_by_coordinates, search_around_address
-)
-from .config import ConfigManager
-from .schemas import Property, PropertiesResponse, PropertyListing, ListingsResponse
-from .visualization import GraphGenerator
+import importlib
+
+# Main classes are re-exported for convenience, but loaded on first access
+# (PEP 562) so importing one submodule doesn't pull in pandas, matplotlib
+# and the HTTP stack for every other one
+_LAZY_IMPORTS = {
+    # API classes
+    'RentCastClient': '.api',
+    'BaseHTTPClient': '.api',
+    'HTTPClientError': '.api',
+    'RentCastAPIError': '.api',
+    'RentCastInvalidParametersError': '.api',
+    'RentCastAuthError': '.api',
+    'RentCastNoResultsError': '.api',
+    'RentCastRateLimitError': '.api',
+    'RentCastServerError': '.api',
+    'RentCastTimeoutError': '.api',
+    'get_error_recommendation': '.api',
+    
+    # Core classes
+    'RealEstateAnalyzer': '.core',
+    'RealEstateDataFetcher': '.core',
+    'DatabaseManager': '.core',
+    'PaginationManager': '.core',
+    'APIResponse': '.core',
+    'PaginationParams': '.core',
+    'PaginatedResult': '.core',
+    
+    # Search query classes and convenience functions
+    'SearchCriteria': '.search',
+    'SearchType': '.search',
+    'PropertyType': '.search',
+    'SpecificAddressSearch': '.search',
+    'LocationSearch': '.search',
+    'GeographicalAreaSearch': '.search',
+    'SearchQueryBuilder': '.search',
+    'search_by_address': '.search',
+    'search_by_location': '.search',
+    'search_by_coordinates': '.search',
+    'search_around_address': '.search',
+    
+    # Configuration
+    'ConfigManager': '.config',
+    
+    # Main schemas
+    'Property': '.schemas',
+    'PropertiesResponse': '.schemas',
+    'PropertyListing': '.schemas',
+    'ListingsResponse': '.schemas',
+    
+    # Visualization
+    'GraphGenerator': '.visualization',
+}
+
+
+def __getattr__(name: str):
+    """Import a re-exported name from its subpackage on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __version__ = "1.0.0"
 
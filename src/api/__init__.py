@@ -4,7 +4,7 @@ API Module
 This package contains HTTP clients and API communication components.
 """
 
-from .http_client import BaseHTTPClient, HTTPClientError, RateLimiter
+from .http_client import BaseHTTPClient, HTTPClientError, RateLimiter, AdaptiveRateLimiter
 from .rentcast_client import RentCastClient, RentCastClientError
 from .rentcast_errors import (
     RentCastAPIError,
@@ -25,6 +25,7 @@ __all__ = [
     'BaseHTTPClient',
     'HTTPClientError', 
     'RateLimiter',
+    'AdaptiveRateLimiter',
     'RentCastClient',
     'RentCastClientError',
     'RentCastAPIError',
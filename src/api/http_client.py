@@ -6,14 +6,56 @@ rate limiting, and retry logic. Includes RentCast-specific error handling.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+import random
+import socket
+import threading
 import time
 import logging
 from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _header_number(headers: Any, name: str) -> Optional[float]:
+    """Parse a numeric response header, returning None if absent or malformed."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keepalive on pooled connections."""
+    
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        # Keep idle pooled sockets alive between paginated bursts so they
+        # aren't silently dropped by NATs/load balancers and re-handshaken
+        kwargs.setdefault('socket_options', HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ])
+        super().init_poolmanager(*args, **kwargs)
+
+
 class HTTPClientError(Exception):
     """Custom exception for HTTP client errors."""
     def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None):
@@ -25,10 +67,15 @@ class HTTPClientError(Exception):
 
 class RateLimiter:
     """
-    Rate limiter specifically designed for RentCast API's 20 requests per second limit.
+    Token-bucket rate limiter for RentCast API's 20 requests per second limit.
     
     RentCast enforces a hard limit of 20 requests per second per API key.
-    This rate limiter ensures compliance with that limit.
+    The bucket refills continuously at ``max_requests / time_window`` tokens
+    per second but holds at most one token, so requests go out evenly spaced
+    ``time_window / max_requests`` apart and no window of ``time_window``
+    seconds sees more than ``max_requests`` of them. A bucket holding a full
+    window's tokens would let a burst through on top of the refill and
+    exceed the limit.
     """
     
     def __init__(self, max_requests: int = 20, time_window: int = 1):
@@ -40,43 +87,142 @@ class RateLimiter:
             time_window: Time window in seconds (default: 1 second for RentCast)
         """
         self.max_requests = max_requests
+        self.ceiling = max_requests
         self.time_window = time_window
-        self.requests = []
+        self.tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
         
         # Log configuration
         logger.info(f"Rate limiter configured: {max_requests} requests per {time_window} second(s)")
     
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, capped at one token."""
+        now = time.monotonic()
+        rate = self.max_requests / self.time_window
+        self.tokens = min(1.0, self.tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+    
     def wait_if_needed(self) -> None:
         """
-        Wait if rate limit would be exceeded.
+        Take one token from the bucket, waiting for a refill if it is empty.
         
         RentCast API has a hard limit of 20 requests per second.
         This method ensures we don't exceed that limit.
         """
-        now = time.time()
+        with self._lock:
+            self._refill()
+            
+            # Wait just long enough for the next token
+            if self.tokens < 1:
+                wait_time = (1 - self.tokens) * self.time_window / self.max_requests
+                logger.debug(f"Rate limit reached ({self.max_requests} per {self.time_window}s), "
+                             f"waiting {wait_time:.3f} seconds")
+                time.sleep(wait_time)
+                self._refill()
+            
+            self.tokens -= 1
+    
+    def update_from_headers(self, headers: Any) -> None:
+        """
+        Adjust the per-window budget from the provider's rate-limit headers.
         
-        # Remove old requests outside the time window
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
+        Shrinks the budget when ``X-RateLimit-Remaining`` drops below it and
+        grows it back toward the configured ceiling once the provider reports
+        plenty of headroom again.
         
-        # Check if we need to wait
-        if len(self.requests) >= self.max_requests:
-            oldest_request = min(self.requests)
-            wait_time = self.time_window - (now - oldest_request)
-            if wait_time > 0:
-                logger.info(f"Rate limit reached ({len(self.requests)}/{self.max_requests} requests), waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
-                # Clear requests after waiting to start fresh
-                self.requests = []
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        remaining_value = _header_number(headers, 'X-RateLimit-Remaining')
+        if remaining_value is None:
+            return
+        remaining = int(remaining_value)
+        
+        if remaining < self.max_requests:
+            new_budget = max(1, remaining)
+        elif remaining > 2 * self.max_requests and self.max_requests < self.ceiling:
+            new_budget = min(self.ceiling, self.max_requests * 2)
+        else:
+            return
+        
+        if new_budget != self.max_requests:
+            logger.debug(f"Adjusting rate limit budget from {self.max_requests} to {new_budget} "
+                         f"(provider reports {remaining} remaining)")
+            self.max_requests = new_budget
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Rate limiter that also paces requests against the provider's reset window.
+    
+    When ``X-RateLimit-Remaining`` runs low, the remaining requests are spread
+    evenly until ``X-RateLimit-Reset`` instead of bursting into a 429. Each
+    request reserves its own send slot ``pace_delay`` after the previous one,
+    so concurrent callers are paced one after another rather than all
+    sleeping once and firing together.
+    """
+    
+    def __init__(self, max_requests: int = 20, time_window: int = 1,
+                 max_pace_delay: float = 60.0):
+        """
+        Initialize adaptive rate limiter.
+        
+        Args:
+            max_requests: Maximum number of requests allowed per window
+            time_window: Time window in seconds
+            max_pace_delay: Upper bound in seconds on the pacing delay per request
+        """
+        super().__init__(max_requests=max_requests, time_window=time_window)
+        self.max_pace_delay = max_pace_delay
+        self.pace_delay = 0.0
+        self._next_slot = 0.0
+    
+    def wait_if_needed(self) -> None:
+        """Wait for this request's paced send slot, if pacing is active, then the window limit."""
+        if self.pace_delay > 0:
+            # Reserve the slot under the lock; sleep outside it so other
+            # callers can reserve the slots after this one meanwhile
+            with self._lock:
+                now = time.monotonic()
+                self._next_slot = max(now, self._next_slot) + self.pace_delay
+                wait_time = self._next_slot - now
+            logger.debug(f"Pacing request by {wait_time:.2f}s to stay within provider quota")
+            time.sleep(wait_time)
+        super().wait_if_needed()
+    
+    def update_from_headers(self, headers: Any) -> None:
+        """
+        Adjust budget and pacing from the provider's rate-limit headers.
+        
+        While pacing against the reset time, the per-window budget is left
+        alone: ``X-RateLimit-Remaining`` is a quota for the whole reset
+        interval, and the pacing already spreads it over that interval.
         
-        # Record this request
-        self.requests.append(now)
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        reset = _header_number(headers, 'X-RateLimit-Reset')
+        if remaining is None or reset is None or remaining > self.ceiling:
+            super().update_from_headers(headers)
+            self.pace_delay = 0.0
+            return
+        
+        now = time.time()
+        # Providers send either an epoch timestamp or seconds until reset
+        seconds_to_reset = reset - now if reset > 1e9 else reset
+        self.pace_delay = min(self.max_pace_delay,
+                              max(0.0, seconds_to_reset) / max(remaining, 1.0))
 
 
 class BaseHTTPClient:
     """Base HTTP client with common functionality."""
     
     def __init__(self, base_url: str, default_headers: Optional[Dict[str, str]] = None,
-                 timeout: int = 30, max_retries: int = 3, rate_limiter: Optional[RateLimiter] = None):
+                 timeout: int = 30, max_retries: int = 3,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 pool_maxsize: int = 10, retry_backoff: float = 1.0):
         """
         Initialize HTTP client.
         
@@ -86,14 +232,28 @@ class BaseHTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             rate_limiter: Optional rate limiter instance
+            pool_maxsize: Maximum number of pooled keep-alive connections per
+                host; should be at least the number of concurrent callers, as
+                further callers wait for a free connection
+            retry_backoff: Base delay in seconds for exponential backoff after
+                connection errors and timeouts
         """
         self.base_url = base_url.rstrip('/')
         self.default_headers = default_headers or {}
         self.timeout = timeout
         self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
         self.rate_limiter = rate_limiter
         self.session = requests.Session()
         
+        # Size the connection pool so concurrent requests reuse connections.
+        # pool_block makes callers beyond pool_maxsize wait for a pooled
+        # connection rather than paying for a one-off TLS handshake whose
+        # socket is then discarded.
+        adapter = _KeepAliveHTTPAdapter(pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Set default headers on session
         self.session.headers.update(self.default_headers)
         
@@ -104,12 +264,15 @@ class BaseHTTPClient:
         endpoint = endpoint.lstrip('/')
         return urljoin(f"{self.base_url}/", endpoint)
     
-    def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Prepare headers for request."""
-        request_headers = self.default_headers.copy()
-        if headers:
-            request_headers.update(headers)
-        return request_headers
+    def _prepare_headers(self,
+                         headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """
+        Prepare per-request headers.
+        
+        The session already carries the default headers, so only explicit
+        overrides need to be sent with the request.
+        """
+        return dict(headers) if headers else None
     
     def _handle_response(self, response: requests.Response, use_rentcast_errors: bool = False) -> Dict[str, Any]:
         """
@@ -134,7 +297,8 @@ class BaseHTTPClient:
             # Parse response body
             response_data = None
             try:
-                response_data = response.json()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                response_data = _json_loads(response.content)
             except json.JSONDecodeError:
                 logger.warning("Response is not valid JSON")
                 response_data = {"data": response.text}
@@ -204,12 +368,19 @@ class BaseHTTPClient:
                     **kwargs
                 )
                 
+                # Let the limiter track the provider's advertised budget
+                if self.rate_limiter:
+                    self.rate_limiter.update_from_headers(response.headers)
+                
                 # For non-2xx responses, check if we should retry based on status code
                 if not (200 <= response.status_code < 300):
                     should_retry = self._should_retry_status_code(response.status_code, use_rentcast_errors)
                     
                     if should_retry and attempt < self.max_retries:
                         wait_time = self._get_retry_delay(response.status_code, attempt, use_rentcast_errors)
+                        retry_after = self._get_retry_after(response)
+                        if retry_after is not None:
+                            wait_time = retry_after
                         logger.warning(f"HTTP {response.status_code} received (attempt {attempt + 1}), retrying in {wait_time}s")
                         time.sleep(wait_time)
                         continue
@@ -219,8 +390,11 @@ class BaseHTTPClient:
             except requests.exceptions.RequestException as e:
                 last_exception = e
                 if attempt < self.max_retries:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {wait_time}s: {str(e)}")
+                    # Exponential backoff with jitter to avoid synchronized retries
+                    wait_time = self.retry_backoff * (2 ** attempt) + random.random() * 0.1
+                    logger.warning(f"Request failed (attempt {attempt + 1}), "
+                                   f"retrying in {wait_time:.2f}s: {str(e)}")
+
                     time.sleep(wait_time)
                 else:
                     logger.error(f"Request failed after {self.max_retries + 1} attempts: {str(e)}")
@@ -241,21 +415,46 @@ class BaseHTTPClient:
         # Generic retry logic for server errors only
         return 500 <= status_code < 600
     
+    def _get_retry_after(self, response: requests.Response) -> Optional[float]:
+        """Get the server-requested retry delay from a Retry-After header, if any."""
+        retry_after = response.headers.get('Retry-After')
+        if not retry_after:
+            return None
+        
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
     def _get_retry_delay(self, status_code: int, attempt: int, use_rentcast_errors: bool) -> float:
         """Get retry delay based on status code and attempt."""
+        delay = None
         if use_rentcast_errors:
             try:
                 from .rentcast_errors import create_rentcast_exception, get_retry_delay
                 temp_exception = create_rentcast_exception(status_code)
-                return get_retry_delay(temp_exception, attempt)
+                delay = get_retry_delay(temp_exception, attempt)
             except ImportError:
                 pass
         
-        # Default exponential backoff
-        if status_code == 429:  # Rate limit
-            return min(60.0, 5.0 * (2 ** attempt))
-        else:
-            return min(30.0, 2.0 * (2 ** attempt))
+        if delay is None:
+            # Default exponential backoff
+            if status_code == 429:  # Rate limit
+                delay = min(60.0, 5.0 * (2 ** attempt))
+            else:
+                delay = min(30.0, 2.0 * (2 ** attempt))
+        
+        if status_code == 429:
+            # Jitter rate-limit retries so concurrent callers don't retry in lockstep
+            delay += random.uniform(0, delay * 0.25)
+        
+        return delay
     
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, 
             headers: Optional[Dict[str, str]] = None, use_rentcast_errors: bool = False) -> Dict[str, Any]:
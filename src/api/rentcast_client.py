@@ -6,9 +6,11 @@ Handles authentication, request formatting, response parsing, and RentCast-speci
 """
 
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, TYPE_CHECKING
 
-from .http_client import BaseHTTPClient, RateLimiter, HTTPClientError
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .http_client import BaseHTTPClient, RateLimiter, AdaptiveRateLimiter, HTTPClientError
 from .rentcast_errors import (
     RentCastAPIError, 
     RentCastNoResultsError
@@ -19,8 +21,9 @@ from ..schemas.rentcast_schemas import (
     AVMValueResponse,
     Property
 )
-from ..search.search_queries import SearchCriteria
 
+if TYPE_CHECKING:
+    from ..search.search_queries import SearchCriteria
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +58,9 @@ class RentCastClient:
         }
     
     def __init__(self, api_key: str, base_url: str = "https://api.rentcast.io/v1",
-                 rate_limit: int = 20, timeout: int = 30, max_retries: int = 3):
+                 rate_limit: int = 20, timeout: int = 30, max_retries: int = 3,
+                 rate_limiter: Optional[RateLimiter] = None, pool_maxsize: int = 10,
+                 retry_backoff: float = 1.0):
         """
         Initialize RentCast client.
         
@@ -65,18 +70,26 @@ class RentCastClient:
             rate_limit: Maximum requests per second (default: 20, RentCast's hard limit)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            rate_limiter: Optional rate limiter to use instead of the default
+                header-aware AdaptiveRateLimiter
+            pool_maxsize: Maximum number of pooled connections, sized to the
+                number of concurrent requests
+            retry_backoff: Base delay in seconds for retrying connection errors
         """
         self.api_key = api_key
         
         # Set up default headers based on curl example
         default_headers = {
             'Accept': 'application/json',
+            # Listing payloads are repetitive JSON and compress well
+            'Accept-Encoding': ACCEPT_ENCODING,
             'X-Api-Key': self.api_key,
             'User-Agent': 'RealEstateAnalyzer/1.0'
         }
         
         # Create rate limiter (RentCast has a hard limit of 20 requests per second)
-        rate_limiter = RateLimiter(max_requests=rate_limit, time_window=1)
+        if rate_limiter is None:
+            rate_limiter = AdaptiveRateLimiter(max_requests=rate_limit, time_window=1)
         
         # Initialize base HTTP client
         self.client = BaseHTTPClient(
@@ -84,7 +97,9 @@ class RentCastClient:
             default_headers=default_headers,
             timeout=timeout,
             max_retries=max_retries,
-            rate_limiter=rate_limiter
+            rate_limiter=rate_limiter,
+            pool_maxsize=pool_maxsize,
+            retry_backoff=retry_backoff
         )
         
         logger.info(f"RentCast client initialized with rate limit: {rate_limit} req/sec (RentCast hard limit: 20 req/sec)")
@@ -183,9 +198,9 @@ class RentCastClient:
         params = {k: str(v) if isinstance(v, (int, float)) else v 
                  for k, v in params.items() if v is not None}
         
-        logger.info(f"Structured property search with params: {params}")
-        search_type_name = getattr(search_criteria, 'search_type', 'Unknown')
-        logger.info(f"Search type: {search_type_name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Structured property search with params: {params}")
+            logger.info(f"Search type: {search_criteria.search_type}")
         
         try:
             response_data = self._make_request(self.ENDPOINTS['properties'], params=params)
@@ -220,9 +235,9 @@ class RentCastClient:
         params = {k: str(v) if isinstance(v, (int, float)) else v 
                  for k, v in params.items() if v is not None}
         
-        logger.info(f"Structured sale listings search with params: {params}")
-        search_type_name = getattr(search_criteria, 'search_type', 'Unknown')
-        logger.info(f"Search type: {search_type_name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Structured sale listings search with params: {params}")
+            logger.info(f"Search type: {search_criteria.search_type}")
         
         try:
             return self._make_request(self.ENDPOINTS['listings_sale'], params=params)
@@ -254,9 +269,9 @@ class RentCastClient:
         params = {k: str(v) if isinstance(v, (int, float)) else v 
                  for k, v in params.items() if v is not None}
         
-        logger.info(f"Structured rental listings search with params: {params}")
-        search_type_name = getattr(search_criteria, 'search_type', 'Unknown')
-        logger.info(f"Search type: {search_type_name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Structured rental listings search with params: {params}")
+            logger.info(f"Search type: {search_criteria.search_type}")
         
         try:
             return self._make_request(self.ENDPOINTS['listings_rental_long_term'], params=params)
@@ -637,6 +652,7 @@ class RentCastClient:
             # The listings/sale endpoint returns a list of listings directly
             if isinstance(validated_response, list):
                 listings = []
+                raw = []
                 for listing_data in validated_response:
                     # Ensure listing_data is a dictionary
                     if not isinstance(listing_data, dict):
@@ -671,10 +687,12 @@ class RentCastClient:
                         'history': listing_data.get('history')
                     }
                     listings.append(PropertyListing.from_dict(mapped_data))
+                    raw.append(listing_data)
                 
                 return ListingsResponse(
                     listings=listings,
-                    total_count=len(listings)  # API doesn't provide total count for direct list
+                    total_count=None,  # API doesn't provide total count for direct list
+                    raw=raw
                 )
             elif isinstance(validated_response, dict):
                 # Handle dict response format
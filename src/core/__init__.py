@@ -5,11 +5,37 @@ This package contains the core business logic for the real estate analyzer,
 including data analysis, fetching, database operations, and deal analysis pipeline.
 """
 
-from .data_analyzer import RealEstateAnalyzer
-from .data_fetcher import RealEstateDataFetcher, PaginationManager, APIResponse
-from .database import DatabaseManager, PaginationParams, PaginatedResult
-from .deal_analyzer import BasicDealAnalyzer, DealScore
-from .deal_analysis_pipeline import DealAnalysisPipeline
+import importlib
+
+# Loaded on first access (PEP 562) so e.g. importing the data fetcher
+# doesn't also import pandas via the analyzer
+_LAZY_IMPORTS = {
+    'RealEstateAnalyzer': '.data_analyzer',
+    'RealEstateDataFetcher': '.data_fetcher',
+    'PaginationManager': '.data_fetcher',
+    'APIResponse': '.data_fetcher',
+    'DatabaseManager': '.database',
+    'PaginationParams': '.database',
+    'PaginatedResult': '.database',
+    'SearchCache': '.search_cache',
+    'BasicDealAnalyzer': '.deal_analyzer',
+    'DealScore': '.deal_analyzer',
+    'DealAnalysisPipeline': '.deal_analysis_pipeline',
+}
+
+
+def __getattr__(name: str):
+    """Import a re-exported name from its module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Core classes
@@ -26,5 +52,6 @@ __all__ = [
     'APIResponse',
     'DatabaseManager',
     'PaginationParams', 
-    'PaginatedResult'
+    'PaginatedResult',
+    'SearchCache'
 ]
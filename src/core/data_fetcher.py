@@ -7,30 +7,203 @@ Includes comprehensive pagination support for API endpoints and structured searc
 Focuses on active market listings (sales and rentals) rather than static property data.
 """
 
+import asyncio
 import logging
+import math
+import os
+import queue
 import requests
+import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Generator, Union
+from functools import lru_cache
+from itertools import chain, islice
+from typing import (Dict, List, Optional, Any, Callable, Generator, Iterator, Tuple, Union,
+                    TYPE_CHECKING)
 
-from ..api.rentcast_client import RentCastClient, RentCastClientError
-from ..api.http_client import HTTPClientError
-from ..schemas.rentcast_schemas import PropertiesResponse, ListingsResponse
-from ..search.search_queries import (
-    SearchCriteria, SearchQueryBuilder, search_by_address, 
-    search_by_location, search_by_coordinates, search_around_address
-)
+if TYPE_CHECKING:
+    # Imported lazily at runtime so callers that never touch RentCast
+    # don't pay for loading the client and search modules
+    import pandas as pd
+    from ..api.rentcast_client import RentCastClient
+    from ..schemas.rentcast_schemas import PropertiesResponse, ListingsResponse
+    from ..search.search_queries import SearchCriteria, SearchQueryBuilder
+    from .search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
+# Pagination endpoint for each accepted listing_type value (casefolded)
+_LISTING_ENDPOINTS = {
+    'sale': 'listings_sale',
+    'rental': 'listings_rental_long_term',
+    'rent': 'listings_rental_long_term',
+}
 
-@dataclass
+# Price-cap parameter name for each listings mode
+_PRICE_CAP_PARAMS = {
+    'sale': 'maxPrice',
+    'rental': 'maxRent',
+}
+
+# Client method and record attribute for each paginated endpoint
+_ENDPOINT_PARSERS = {
+    'properties': ('search_properties', 'properties'),
+    'listings_sale': ('get_listings_sale', 'listings'),
+    # Rental listings come back as a PropertiesResponse
+    'listings_rental_long_term': ('get_listings_rental_long_term', 'properties'),
+}
+
+# Client method for structured searches against each listings endpoint
+_STRUCTURED_LISTING_METHODS = {
+    'listings_sale': 'search_listings_sale_structured',
+    'listings_rental_long_term': 'search_listings_rental_structured',
+}
+
+# Sentinel marking the end of a prefetched page stream
+_PREFETCH_DONE = object()
+
+# Approximate miles per degree of latitude
+_MILES_PER_DEGREE = 69.0
+
+# Coordinate search grid: 4 decimal places is ~11 m; radii snap up to quarter miles
+_COORDINATE_DECIMALS = 4
+_RADIUS_STEP_MILES = 0.25
+
+# Results RentCast returns for a search that sends no limit
+_API_DEFAULT_LIMIT = 50
+
+
+def _distance_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Approximate distance in miles (equirectangular; fine at search-radius scale)."""
+    x = (lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = lat2 - lat1
+    return math.hypot(x, y) * _MILES_PER_DEGREE
+
+
+def _quantize_coordinates(latitude: float, longitude: float,
+                          radius: float) -> Tuple[float, float, float]:
+    """
+    Snap a coordinate search onto a coarse grid so nearby searches share a cache entry.
+    
+    The center is rounded to ``_COORDINATE_DECIMALS`` places and the radius is
+    rounded *up* to a multiple of ``_RADIUS_STEP_MILES``, widened by the center
+    shift so the snapped circle always contains the requested one.
+    
+    Args:
+        latitude: Center latitude
+        longitude: Center longitude
+        radius: Search radius in miles
+        
+    Returns:
+        (latitude, longitude, radius) tuple on the grid
+    """
+    grid_latitude = round(latitude, _COORDINATE_DECIMALS)
+    grid_longitude = round(longitude, _COORDINATE_DECIMALS)
+    shift = _distance_miles(latitude, longitude, grid_latitude, grid_longitude)
+    grid_radius = math.ceil(round((radius + shift) / _RADIUS_STEP_MILES, 9)) * _RADIUS_STEP_MILES
+    return grid_latitude, grid_longitude, grid_radius
+
+
+def _api_errors() -> tuple:
+    """Exception types that signal a failed API call or malformed response."""
+    from ..api.http_client import HTTPClientError
+    from ..api.rentcast_errors import RentCastAPIError
+    
+    return (RentCastAPIError, HTTPClientError, requests.RequestException, ValueError, KeyError)
+
+
+@lru_cache(maxsize=1024)
+def _build_address_criteria(address: str, frozen_kwargs: Tuple) -> 'SearchCriteria':
+    """Build (and memoize) a specific-address search."""
+    from ..search.search_queries import search_by_address
+    
+    return search_by_address(address, **dict(frozen_kwargs))
+
+
+@lru_cache(maxsize=1024)
+def _build_location_criteria(city: Optional[str], state: Optional[str], zip_code: Optional[str],
+                             frozen_kwargs: Tuple) -> 'SearchCriteria':
+    """Build (and memoize) a city/state/ZIP search."""
+    from ..search.search_queries import search_by_location
+    
+    return search_by_location(city=city, state=state, zip_code=zip_code, **dict(frozen_kwargs))
+
+
+@lru_cache(maxsize=1024)
+def _build_coordinates_criteria(latitude: float, longitude: float, radius: float,
+                                frozen_kwargs: Tuple) -> 'SearchCriteria':
+    """Build (and memoize) a coordinate radius search."""
+    from ..search.search_queries import search_by_coordinates
+    
+    return search_by_coordinates(latitude=latitude, longitude=longitude, radius=radius,
+                                 **dict(frozen_kwargs))
+
+
+def _cached_criteria(builder: Callable, *args: Any, **kwargs: Any) -> 'SearchCriteria':
+    """
+    Build search criteria through one of the memoized builders above.
+    
+    Identical calls share one criteria object, so callers must treat the
+    result as read-only. Unhashable kwargs (e.g. list values) bypass the cache.
+    
+    Args:
+        builder: _build_address_criteria, _build_location_criteria or _build_coordinates_criteria
+        *args: Positional builder arguments
+        **kwargs: Additional search criteria
+        
+    Returns:
+        Search criteria object
+    """
+    frozen_kwargs = tuple(sorted(kwargs.items()))
+    try:
+        return builder(*args, frozen_kwargs)
+    except TypeError:
+        try:
+            hash(frozen_kwargs)
+        except TypeError:
+            return builder.__wrapped__(*args, frozen_kwargs)
+        raise
+
+
+def _response_records(response: Any, items: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Get the record dicts for a parsed response.
+    
+    Uses the source dicts the response was parsed from when available, so
+    records are not rebuilt with ``to_dict()`` (which also drops fields the
+    model does not know about).
+    
+    Args:
+        response: PropertiesResponse or ListingsResponse
+        items: The response's parsed models
+        
+    Returns:
+        List of record dictionaries
+    """
+    raw = getattr(response, 'raw', None)
+    if raw and len(raw) == len(items):
+        return raw
+    if not items:
+        return []
+    # Bind the method once rather than looking it up per item
+    to_dict = type(items[0]).to_dict
+    return [to_dict(item) for item in items]
+
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class APIResponse:
     """Container for API response data and metadata."""
     data: List[Dict[str, Any]]
     total_count: Optional[int] = None
-    has_more: bool = False
+    has_more: Optional[bool] = None  # None when the server did not say
     next_offset: Optional[int] = None
     source: Optional[str] = None
 
@@ -38,108 +211,187 @@ class APIResponse:
 class PaginationManager:
     """Manages pagination for API requests."""
     
-    def __init__(self, default_limit: int = 50, max_limit: int = 500):
+    def __init__(self, default_limit: int = 50, max_limit: int = 500,
+                 max_workers: int = 4, prefetch_depth: int = 8):
         """
         Initialize pagination manager.
         
         Args:
             default_limit: Default page size
             max_limit: Maximum allowed page size
+            max_workers: Maximum number of pages fetched concurrently once the
+                total result count is known (1 disables concurrent fetching)
+            prefetch_depth: Maximum number of pages buffered ahead of the
+                consumer by prefetch_pages (0 disables prefetching)
         """
         self.default_limit = default_limit
         self.max_limit = max_limit
+        self.max_workers = max(1, max_workers)
+        self.prefetch_depth = max(0, prefetch_depth)
+    
+    def _fetch_page(self, client: 'RentCastClient', endpoint: str,
+                    request_params: Dict[str, Any]) -> Optional[APIResponse]:
+        """
+        Fetch a single page from the given endpoint.
+        
+        Args:
+            client: API client instance
+            endpoint: API endpoint to call
+            request_params: Request parameters including limit and offset
+            
+        Returns:
+            APIResponse for the page, or None if the endpoint is unknown
+        """
+        parser = _ENDPOINT_PARSERS.get(endpoint)
+        if parser is None:
+            logger.error(f"Unknown endpoint for pagination: {endpoint}")
+            return None
+        
+        method_name, records_attr = parser
+        response: Union['PropertiesResponse', 'ListingsResponse'] = getattr(client, method_name)(
+            **request_params)
+        
+        return APIResponse(
+            data=_response_records(response, getattr(response, records_attr)),
+            total_count=response.total_count,
+            has_more=response.has_more,
+            next_offset=response.next_offset,
+            source='rentcast'
+        )
     
-    def paginate_request(self, client: RentCastClient, endpoint: str,
+    def _fetch_pages_concurrently(self, client: 'RentCastClient', endpoint: str,
+                                  params: Dict[str, Any], offsets: List[int], limit: int,
+                                  max_workers: int) -> Generator[APIResponse, None, None]:
+        """
+        Fetch a known set of page offsets concurrently, yielding pages in order.
+        
+        Args:
+            client: API client instance
+            endpoint: API endpoint to call
+            params: Base request parameters
+            offsets: Page offsets to fetch
+            limit: Page size
+            max_workers: Maximum number of concurrent page requests (1 fetches
+                inline); up to twice as many pages are queued ahead
+            
+        Yields:
+            APIResponse objects in offset order
+        """
+        def fetch(page_offset: int) -> Optional[APIResponse]:
+            return self._fetch_page(client, endpoint,
+                                    {**params, 'limit': limit, 'offset': page_offset})
+        
+        if max_workers <= 1:
+            for page_offset in offsets:
+                page = fetch(page_offset)
+                if page is None or not page.data:
+                    break
+                yield page
+            return
+        
+        # Keep a bounded window of pages in flight, topping it up as pages
+        # are consumed, so a huge total_count doesn't queue every offset
+        # (and buffer every page) at once
+        max_workers = min(max_workers, len(offsets))
+        remaining = iter(offsets)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            in_flight = deque(executor.submit(fetch, page_offset)
+                              for page_offset in islice(remaining, 2 * max_workers))
+            while in_flight:
+                page = in_flight.popleft().result()
+                if page is None or not page.data:
+                    break
+                for page_offset in islice(remaining, 1):
+                    in_flight.append(executor.submit(fetch, page_offset))
+                yield page
+        finally:
+            # Don't wait on pages the caller no longer needs
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def paginate_request(self, client: 'RentCastClient', endpoint: str,
                         params: Dict[str, Any],
-                        max_pages: Optional[int] = None) -> Generator[APIResponse, None, None]:
+                        max_pages: Optional[int] = None,
+                        concurrent: bool = True) -> Generator[APIResponse, None, None]:
         """
         Generator that yields paginated API responses.
         
+        When the first page reports a total result count, the remaining
+        pages are requested by explicit offset range, concurrently through a
+        thread pool, and yielded in order. Otherwise pages are requested one
+        at a time by following next_offset/has_more. Only when the server
+        sends none of these does a short page mark the end of results.
+        
         Args:
             client: API client instance
             endpoint: API endpoint to call
             params: Base request parameters
             max_pages: Maximum number of pages to fetch (None for unlimited)
+            concurrent: Whether to fetch the offset range concurrently; pass
+                False to request pages strictly one at a time
             
         Yields:
             APIResponse objects containing page data
         """
+        api_errors = _api_errors()
+        
         limit = min(params.get('limit', self.default_limit), self.max_limit)
         offset = params.get('offset', 0)
         pages_fetched = 0
         
+        # Built once; only the offset changes from page to page (the client
+        # unpacks the params, so it never holds on to this dict)
+        request_params = {**params, 'limit': limit}
+        
         while max_pages is None or pages_fetched < max_pages:
             try:
-                # Update pagination parameters
-                request_params = params.copy()
-                request_params.update({
-                    'limit': limit,
-                    'offset': offset
-                })
+                request_params['offset'] = offset
                 
                 # Make API request
-                logger.info(f"Fetching page {pages_fetched + 1} with offset "
-                           f"{offset}, limit {limit}")
-                
-                response: Union[PropertiesResponse, ListingsResponse, Any]
+                logger.info("Fetching page %d with offset %d, limit %d",
+                            pages_fetched + 1, offset, limit)
                 
-                if endpoint == 'properties':
-                    response = client.search_properties(**request_params)
-                elif endpoint == 'listings_sale':
-                    response = client.get_listings_sale(**request_params)
-                elif endpoint == 'listings_rental_long_term':
-                    response = client.get_listings_rental_long_term(**request_params)
-                else:
-                    logger.error(f"Unknown endpoint for pagination: {endpoint}")
+                api_response = self._fetch_page(client, endpoint, request_params)
+                if api_response is None:
                     break
                 
-                # Process response based on type
-                data: List[Dict[str, Any]] = []
-                total_count: Optional[int] = None
-                has_more: bool = False
-                next_offset: Optional[int] = None
+                data = api_response.data
+                has_more = api_response.has_more
+                next_offset = api_response.next_offset
+                total_count = api_response.total_count
                 
-                # Check response type and extract data
-                if hasattr(response, 'properties'):
-                    # This is a PropertiesResponse
-                    properties = getattr(response, 'properties', [])
-                    data = [prop.to_dict() for prop in properties]
-                    total_count = getattr(response, 'total_count', None)
-                    has_more = getattr(response, 'has_more', False) or False
-                    next_offset = getattr(response, 'next_offset', None)
-                elif hasattr(response, 'listings'):
-                    # This is a ListingsResponse
-                    listings = getattr(response, 'listings', [])
-                    data = [listing.to_dict() for listing in listings]
-                    total_count = getattr(response, 'total_count', None)
-                    has_more = getattr(response, 'has_more', False) or False
-                    next_offset = getattr(response, 'next_offset', None)
-                else:
-                    # Handle single property or other response types
-                    if hasattr(response, 'to_dict'):
-                        data = [response.to_dict()]
-                    elif isinstance(response, dict):
-                        data = [response]
-                    else:
-                        data = []
-                    total_count = len(data)
-                    has_more = False
-                    next_offset = None
+                yield api_response
+                pages_fetched += 1
                 
-                # Create response object
-                api_response = APIResponse(
-                    data=data,
-                    total_count=total_count,
-                    has_more=has_more,
-                    next_offset=next_offset,
-                    source='rentcast'
-                )
+                # Once the total is known, fetch the rest by explicit offset
+                # range instead of chasing continuation tokens page by page
+                if total_count and data:
+                    remaining_offsets = list(range(offset + limit, total_count, limit))
+                    if max_pages is not None:
+                        remaining_offsets = remaining_offsets[:max_pages - pages_fetched]
+                    
+                    if remaining_offsets:
+                        max_workers = self.max_workers if concurrent else 1
+                        logger.info("Fetching %d remaining pages with up to %d workers",
+                                    len(remaining_offsets), max_workers)
+                        yield from self._fetch_pages_concurrently(
+                            client, endpoint, params, remaining_offsets, limit, max_workers
+                        )
+                    break
                 
-                yield api_response
+                # Check if we should continue, trusting the server's own
+                # continuation signals whenever it sends them
+                if not data:
+                    done = True
+                elif has_more is not None:
+                    done = not has_more
+                elif next_offset is not None:
+                    done = False
+                else:
+                    done = len(data) < limit
                 
-                # Check if we should continue
-                if not data or len(data) < limit or not has_more:
-                    logger.info(f"Reached end of results after {pages_fetched + 1} pages")
+                if done:
+                    logger.info("Reached end of results after %d pages", pages_fetched)
                     break
                 
                 # Update offset for next page
@@ -148,21 +400,72 @@ class PaginationManager:
                 else:
                     offset += limit
                 
-                pages_fetched += 1
-                
-                # Add delay between requests to respect rate limits
-                time.sleep(0.1)
-                
-            except (RentCastClientError, HTTPClientError) as e:
-                logger.error(f"API error during pagination: {str(e)}")
+            except api_errors as e:
+                logger.error(f"API error during pagination: {type(e).__name__}: {str(e)}")
+                logger.debug("Pagination error details", exc_info=True)
                 break
+    
+    def prefetch_pages(self, pages: Generator[APIResponse, None, None]
+                       ) -> Generator[APIResponse, None, None]:
+        """
+        Run a page generator in a background thread, buffering pages ahead of the consumer.
+        
+        The next page is requested while the caller is still processing the
+        current one. At most ``prefetch_depth`` pages are held in memory.
+        
+        Args:
+            pages: Page generator, typically from paginate_request
+            
+        Yields:
+            APIResponse objects in the order produced
+        """
+        if self.prefetch_depth == 0:
+            yield from pages
+            return
+        
+        buffer: queue.Queue = queue.Queue(maxsize=self.prefetch_depth)
+        stop = threading.Event()
+        
+        def put(item: Any) -> None:
+            # Block while the buffer is full, but give up once the consumer stops
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+        
+        def produce() -> None:
+            try:
+                for page in pages:
+                    if stop.is_set():
+                        break
+                    put(page)
             except Exception as e:
-                logger.error(f"Unexpected error during pagination: {str(e)}")
-                break
+                # Hand the error to the consumer thread rather than losing it here
+                put(e)
+            finally:
+                pages.close()
+                put(_PREFETCH_DONE)
+        
+        producer = threading.Thread(target=produce, name='page-prefetch', daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                page = buffer.get()
+                if page is _PREFETCH_DONE:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            stop.set()
     
-    def fetch_all_pages(self, client: RentCastClient, endpoint: str,
+    def fetch_all_pages(self, client: 'RentCastClient', endpoint: str,
                        params: Dict[str, Any],
-                       max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+                       max_pages: Optional[int] = None,
+                       concurrent: bool = True) -> List[Dict[str, Any]]:
         """
         Fetch all pages and return combined results.
         
@@ -171,6 +474,7 @@ class PaginationManager:
             endpoint: API endpoint to call
             params: Base request parameters
             max_pages: Maximum number of pages to fetch
+            concurrent: Whether to fetch pages concurrently once the total is known
             
         Returns:
             Combined list of all results
@@ -178,12 +482,12 @@ class PaginationManager:
         all_data = []
         total_fetched = 0
         
-        for page_response in self.paginate_request(client, endpoint, params, max_pages):
+        for page_response in self.paginate_request(client, endpoint, params, max_pages, concurrent):
             all_data.extend(page_response.data)
             total_fetched += len(page_response.data)
             
-            logger.info(f"Fetched {len(page_response.data)} items in this page, "
-                       f"{total_fetched} total so far")
+            logger.info("Fetched %d items in this page, %d total so far",
+                        len(page_response.data), total_fetched)
         
         logger.info(f"Pagination complete. Total items fetched: {total_fetched}")
         return all_data
@@ -201,14 +505,181 @@ class RealEstateDataFetcher:
         """
         self.api_config = api_config
         self.session = requests.Session()
-        self.rate_limits = {}  # Track rate limits for different APIs
+        
+        # RentCast settings are read once here rather than on every call
+        self._api_key: Optional[str] = api_config.get('rentcast_api_key')
+        self._endpoint: str = api_config.get('rentcast_endpoint', 'https://api.rentcast.io/v1')
+        self._rate_limit: int = api_config.get('rentcast_rate_limit', 100)
+        self._max_retries: int = api_config.get('rentcast_max_retries', 3)
+        self._retry_backoff: float = api_config.get('rentcast_retry_backoff', 1.0)
+        self._rentcast_enabled: bool = api_config.get('rentcast_enabled', False)
+        if self._rentcast_enabled and not self._api_key:
+            logger.warning("RentCast is enabled but no API key is configured")
+        
+        # Zip-code sweep configuration for fetch_rentcast_data; repeated zip
+        # codes are searched once
+        self._zip_codes: List[str] = list(dict.fromkeys(api_config.get('zip_codes', [])))
+        self._zip_processing: Dict[str, Any] = api_config.get('zip_code_processing', {})
+        
+        # Thread count for concurrent zip-code sweeps and search_many
+        self._search_workers: int = api_config.get('search_workers', 8)
+        # Largest covering radius (miles) for coalesced coordinate searches
+        self._coalesce_max_radius: float = api_config.get('coordinate_coalesce_max_radius', 25)
+        
+        # Token bucket shared by every RentCast call made through this fetcher
+        from ..api.http_client import AdaptiveRateLimiter
+        self._rate_limiter = AdaptiveRateLimiter(max_requests=self._rate_limit, time_window=1)
+        
+        # Shared RentCast client, created on first use
+        self._client: Optional['RentCastClient'] = None
+        self._client_lock = threading.Lock()
+        
+        # Successful connection probes are reused for this many seconds
+        # (None trusts the first success for the lifetime of the fetcher)
+        self._probe_ttl: Optional[float] = api_config.get('connection_probe_ttl', 60)
+        self._last_probe_ok_ts: Optional[float] = None
+        self._probe_lock = threading.Lock()
+        
+        # LRU cache of address search results keyed by normalized address
+        self._address_cache: OrderedDict = OrderedDict()
+        self._address_cache_size = api_config.get('address_cache_size', 4096)
+        self._address_cache_lock = threading.Lock()
+        
+        # Optional persistent cache of structured search results, enabled by
+        # configuring cache_dir
+        self._search_cache: Optional['SearchCache'] = None
+        self._listing_cache_ttl = api_config.get('listing_cache_ttl', 24 * 3600)
+        self._property_cache_ttl = api_config.get('property_cache_ttl', 7 * 24 * 3600)
+        cache_dir = api_config.get('cache_dir')
+        if cache_dir:
+            from .search_cache import SearchCache
+            self._search_cache = SearchCache(os.path.join(cache_dir, 'search_cache.db'),
+                                             default_ttl=self._listing_cache_ttl)
         
         # Initialize pagination manager
         self.pagination_manager = PaginationManager(
             default_limit=api_config.get('default_page_size', 50),
-            max_limit=api_config.get('max_page_size', 500)
+            max_limit=api_config.get('max_page_size', 500),
+            # Keep concurrent page fetches to half the per-second budget so
+            # they don't starve other callers sharing the token bucket
+            max_workers=min(api_config.get('pagination_workers', 4), max(1, self._rate_limit // 2)),
+            prefetch_depth=api_config.get('prefetch_depth', 8)
         )
         
+        # Optionally open the client and run the connection probe in the
+        # background, so the first interactive search doesn't pay for TLS
+        # setup and the probe request; a search issued meanwhile waits on
+        # the client/probe locks instead of repeating the work
+        if api_config.get('warm_up_connection', False) and self._rentcast_enabled and self._api_key:
+            threading.Thread(target=self._warm_up, name='rentcast-warm-up', daemon=True).start()
+        
+    def _get_client(self) -> Optional['RentCastClient']:
+        """
+        Get the shared RentCast client, creating it on first use.
+        
+        Returns:
+            RentCastClient, or None if the API key is not configured
+        """
+        # Fast path: once created, the client is returned without locking
+        client = self._client
+        if client is not None:
+            return client
+        
+        from ..api.rentcast_client import RentCastClient
+        
+        with self._client_lock:
+            if self._client is not None:
+                return self._client
+            
+            if not self._api_key:
+                logger.warning("RentCast API key not configured")
+                return None
+            
+            # One pooled connection per concurrent page fetch or search
+            pool_maxsize = max(self.pagination_manager.max_workers, self._search_workers)
+            
+            self._client = RentCastClient(
+                api_key=self._api_key,
+                base_url=self._endpoint,
+                rate_limit=self._rate_limit,
+                max_retries=self._max_retries,
+                rate_limiter=self._rate_limiter,
+                pool_maxsize=pool_maxsize,
+                retry_backoff=self._retry_backoff
+            )
+            return self._client
+    
+    def _connection_ok(self, client: 'RentCastClient') -> bool:
+        """
+        Check the RentCast connection, reusing a recent successful probe.
+        
+        A successful test_connection() is trusted for ``connection_probe_ttl``
+        seconds (or for the fetcher's lifetime when it is None) so chained
+        searches and paginated fetches don't each pay for a probe request.
+        Successful API calls also refresh the probe, so a busy fetcher never
+        needs to re-probe.
+        
+        Args:
+            client: Shared RentCast client
+            
+        Returns:
+            True if the connection is known to be working, False otherwise
+        """
+        with self._probe_lock:
+            if self._last_probe_ok_ts is not None and (
+                    self._probe_ttl is None or
+                    time.monotonic() - self._last_probe_ok_ts < self._probe_ttl):
+                return True
+            
+            if not client.test_connection():
+                logger.error("RentCast API connection test failed")
+                self._last_probe_ok_ts = None
+                return False
+            
+            self._last_probe_ok_ts = time.monotonic()
+            return True
+    
+    def _warm_up(self) -> None:
+        """Create the shared client and probe the connection (runs in a background thread)."""
+        try:
+            client = self._get_client()
+            if client is not None and self._connection_ok(client):
+                logger.debug("RentCast client warmed up")
+        except Exception as e:
+            logger.warning(f"RentCast warm-up failed: {str(e)}")
+    
+    def _mark_connection_ok(self) -> None:
+        """Record a successful API call as proof the connection is working."""
+        self._last_probe_ok_ts = time.monotonic()
+    
+    def close(self) -> None:
+        """Close the shared RentCast client, search cache and HTTP session."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        if self._search_cache is not None:
+            self._search_cache.close()
+            self._search_cache = None
+        self.session.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def __del__(self):
+        """Release the pooled client's connections if close() was never called."""
+        client = getattr(self, '_client', None)
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
+    
     def fetch_all_sources(self) -> List[Dict[str, Any]]:
         """
         Fetch data from all configured sources.
@@ -220,7 +691,7 @@ class RealEstateDataFetcher:
         
         try:
             # Fetch from each configured source
-            if self.api_config.get('rentcast_enabled', False):
+            if self._rentcast_enabled:
                 rentcast_data = self.fetch_rentcast_data()
                 all_listings.extend(rentcast_data)
                             
@@ -247,234 +718,234 @@ class RealEstateDataFetcher:
         listings = []
         
         try:
-            api_key = self.api_config.get('rentcast_api_key')
-            if not api_key:
-                logger.warning("RentCast API key not configured")
+            if not self._api_key:
+                # Already warned about once at construction time
+                logger.debug("RentCast API key not configured")
                 return []
             
-            endpoint = self.api_config.get('rentcast_endpoint', 'https://api.rentcast.io/v1')
-            rate_limit = self.api_config.get('rentcast_rate_limit', 100)
-            
-            # Get zip codes configuration from api_config
-            zip_codes = self.api_config.get('zip_codes', [])
-            zip_processing = self.api_config.get('zip_code_processing', {})
+            zip_codes = self._zip_codes
+            zip_processing = self._zip_processing
             
             if not zip_codes:
                 logger.warning("No zip codes configured for data fetching")
                 return []
             
-            # Initialize RentCast client
-            with RentCastClient(
-                api_key=api_key,
-                base_url=endpoint,
-                rate_limit=rate_limit
-            ) as client:
-                
-                # Test connection first
-                if not client.test_connection():
-                    logger.error("RentCast API connection test failed")
-                    return []
-                
-                # Extract configuration parameters
-                listings_per_zip = zip_processing.get('listings_per_zip', zip_processing.get('properties_per_zip', 100))  # Backward compatibility
-                fetch_sales = zip_processing.get('fetch_sales', True)
-                fetch_rentals = zip_processing.get('fetch_rentals', True)
-                delay_between_zips = zip_processing.get('delay_between_zips', 2)
-                property_types = zip_processing.get('property_types', ['Single Family', 'Condo'])
-                filters = zip_processing.get('filters', {})
-                
-                # Process each zip code
-                for zip_code in zip_codes:
-                    logger.info(f"Processing zip code: {zip_code}")
-                    
-                    # Fetch sales listings if enabled
-                    if fetch_sales:
-                        for prop_type in property_types:
-                            # Create search kwargs for sales listings endpoint (same parameter names as rental)
-                            sales_search_kwargs = {
-                                'zipcode': zip_code,  # Note: zipcode (no underscore) for listings endpoint
-                                'propertyType': prop_type,  # Note: propertyType (camelCase) for listings endpoint
-                                'limit': listings_per_zip
-                            }
-                            
-                            # Apply additional filters with correct parameter names for listings endpoint
-                            if filters.get('min_beds'):
-                                sales_search_kwargs['bedrooms'] = filters['min_beds']
-                            if filters.get('min_baths'):
-                                sales_search_kwargs['bathrooms'] = filters['min_baths']
-                            if filters.get('max_price'):
-                                sales_search_kwargs['maxPrice'] = filters['max_price']
-                            
-                            try:
-                                logger.info(f"Searching sales listings in {zip_code} for {prop_type}")
-                                response = client.get_listings_sale(**sales_search_kwargs)
-                                
-                                # Process response data - handle ListingsResponse object
-                                listing_data = []
-                                if hasattr(response, 'listings'):
-                                    # ListingsResponse object
-                                    listing_data = response.listings
-                                elif isinstance(response, dict) and 'listings' in response:
-                                    # Dict response
-                                    listing_data = response['listings']
-                                elif isinstance(response, list):
-                                    # Direct list
-                                    listing_data = response
-                                
-                                if listing_data:
-                                    for listing in listing_data:
-                                        # Convert listing object to dict if needed
-                                        if hasattr(listing, 'to_dict'):
-                                            listing_dict: Dict[str, Any] = listing.to_dict()
-                                        else:
-                                            listing_dict = listing  # type: ignore
-                                        normalized_listing = self._normalize_rentcast_listing(
-                                            listing_dict)
-                                        listings.append(normalized_listing)
-                                        
-                            except RentCastClientError as e:
-                                logger.error(f"RentCast sales listings error for {zip_code}, "
-                                           f"{prop_type}: {e}")
-                                continue
-                    
-                    # Fetch rental listings if enabled
-                    if fetch_rentals:
-                        for prop_type in property_types:
-                            # Create separate search kwargs for rental endpoint (different parameter names)
-                            rental_search_kwargs = {
-                                'zipcode': zip_code,  # Note: zipcode (no underscore) for rental endpoint
-                                'propertyType': prop_type,  # Note: propertyType (camelCase) for rental endpoint
-                                'limit': listings_per_zip
-                            }
-                            
-                            # Apply additional filters with correct parameter names for rental endpoint
-                            if filters.get('min_beds'):
-                                rental_search_kwargs['bedrooms'] = filters['min_beds']
-                            if filters.get('min_baths'):
-                                rental_search_kwargs['bathrooms'] = filters['min_baths']
-                            if filters.get('max_price'):
-                                rental_search_kwargs['maxRent'] = filters['max_price']
-                            
-                            try:
-                                logger.info(f"Searching rentals in {zip_code} for {prop_type}")
-                                # Use listings endpoint for rentals
-                                response = client.get_listings_rental_long_term(**rental_search_kwargs)
-                                
-                                # Process response - rental listings endpoint returns PropertiesResponse
-                                property_data = []
-                                if hasattr(response, 'properties'):
-                                    # PropertiesResponse object (what rental listings endpoint returns)
-                                    property_data = response.properties
-                                elif isinstance(response, dict) and 'properties' in response:
-                                    # Dict response
-                                    property_data = response['properties']
-                                elif isinstance(response, list):
-                                    # Direct list
-                                    property_data = response
-                                
-                                if property_data:
-                                    for listing in property_data:
-                                        # Convert listing object to dict if needed
-                                        if hasattr(listing, 'to_dict'):
-                                            listing_dict: Dict[str, Any] = listing.to_dict()
-                                        else:
-                                            listing_dict = listing  # type: ignore
-                                        normalized_listing = self._normalize_rentcast_listing(
-                                            listing_dict)
-                                        listings.append(normalized_listing)
-                                        
-                            except RentCastClientError as e:
-                                logger.error(f"RentCast rental search error for {zip_code}, "
-                                           f"{prop_type}: {e}")
-                                continue
-                    
-                    # Add delay between zip code processing
-                    if delay_between_zips > 0:
-                        logger.info(f"Waiting {delay_between_zips} seconds before next zip code")
-                        time.sleep(delay_between_zips)
-                
-                logger.info(f"Successfully fetched {len(listings)} listings from RentCast")
-                
+            # Extract configuration parameters
+            # Backward compatibility: fall back to the old properties_per_zip key
+            listings_per_zip = zip_processing.get(
+                'listings_per_zip', zip_processing.get('properties_per_zip', 100))
+
+            fetch_sales = zip_processing.get('fetch_sales', True)
+            fetch_rentals = zip_processing.get('fetch_rentals', True)
+            property_types = zip_processing.get('property_types', ['Single Family', 'Condo'])
+            filters = zip_processing.get('filters', {})
+            
+            # Nothing to search: skip creating and probing the client
+            modes = [mode for mode, enabled in (('sale', fetch_sales), ('rental', fetch_rentals))
+                     if enabled]
+            if not modes:
+                logger.info("Both sales and rental fetching are disabled")
+                return []
+            if not property_types:
+                logger.warning("No property types configured for data fetching")
+                return []
+            
+            # Reuse the shared, pooled RentCast client
+            client = self._get_client()
+            if client is None or not self._connection_ok(client):
+                return []
+            
+            # Filters are the same for every zip code, so build the
+            # endpoint-specific base kwargs once (the two listings endpoints
+            # name the price cap differently)
+            shared_filters = {
+                'bedrooms': filters.get('min_beds'),
+                'bathrooms': filters.get('min_baths'),
+            }
+            base_kwargs = {}
+            for mode in modes:
+                mode_filters = {**shared_filters, _PRICE_CAP_PARAMS[mode]: filters.get('max_price')}
+                base_kwargs[mode] = {'limit': listings_per_zip,
+                                     **{k: v for k, v in mode_filters.items() if v}}
+            
+            # Build one task per zip code, listing mode and property type;
+            # zipcode/propertyType are the listings endpoints' parameter names
+            tasks = [
+                (zip_code, prop_type, mode,
+                 {**mode_kwargs, 'zipcode': zip_code, 'propertyType': prop_type})
+                for zip_code in zip_codes
+                for mode, mode_kwargs in base_kwargs.items()
+                for prop_type in property_types
+            ]
+            
+            # Every listing from this run shares one fetch timestamp
+            fetched_at = datetime.now().isoformat()
+            
+            # Run the sweep on a bounded pool; the shared client's token bucket
+            # keeps the combined request rate within the API limit
+            max_workers = min(self._search_workers, len(tasks))
+            logger.info(f"Fetching {len(tasks)} zip code searches with {max_workers} workers")
+            
+            if max_workers <= 1:
+                results = [self._fetch_zip_task(client, *task, fetched_at=fetched_at)
+                           for task in tasks]
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # map keeps results in task order so deduplication stays stable
+                    results = list(executor.map(
+                        lambda task: self._fetch_zip_task(client, *task, fetched_at=fetched_at),
+                        tasks))
+            
+            listings.extend(chain.from_iterable(results))
+            
+            logger.info(f"Successfully fetched {len(listings)} listings from RentCast")
+            
         except Exception as e:
             logger.error(f"Error fetching RentCast data: {str(e)}")
             
         return listings
 
-    def _normalize_rentcast_listing(self, listing: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize RentCast listing data to standard format."""
+    def _fetch_zip_task(self, client: 'RentCastClient', zip_code: str, prop_type: str,
+                        mode: str, search_kwargs: Dict[str, Any],
+                        fetched_at: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch and normalize one zip code / property type search.
+        
+        Args:
+            client: Shared RentCast client
+            zip_code: Zip code being searched
+            prop_type: Property type being searched
+            mode: 'sale' or 'rental'
+            search_kwargs: Keyword arguments for the listings endpoint
+            fetched_at: ISO timestamp to stamp on every listing (default: now)
+            
+        Returns:
+            List of normalized listing dictionaries (empty on API errors or
+            a malformed response, so one failed search doesn't end the sweep)
+        """
+        from ..api.rentcast_client import RentCastClientError
+        
+        method_name, records_attr = _ENDPOINT_PARSERS[_LISTING_ENDPOINTS[mode]]
+        label = 'sales listings' if mode == 'sale' else 'rentals'
+        
+        try:
+            logger.info(f"Searching {label} in {zip_code} for {prop_type}")
+            response = getattr(client, method_name)(**search_kwargs)
+            self._mark_connection_ok()
+            
+            records = _response_records(response, getattr(response, records_attr))
+            return self._normalize_many(records, fetched_at)
+        except (RentCastClientError, *_api_errors()) as e:
+            logger.error(f"RentCast {label} error for {zip_code}, {prop_type}: "
+                         f"{type(e).__name__}: {e}")
+            return []
+
+    def _normalize_many(self, records: List[Dict[str, Any]],
+                        fetched_at: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Normalize a batch of RentCast records.
+        
+        Args:
+            records: Raw RentCast listing dictionaries
+            fetched_at: ISO timestamp shared by the batch (default: now)
+            
+        Returns:
+            List of normalized listing dictionaries
+        """
+        if fetched_at is None:
+            fetched_at = datetime.now().isoformat()
+        normalize = self._normalize_rentcast_listing
+        return [normalize(record, fetched_at) for record in records]
+    
+    def _normalize_rentcast_listing(self, listing: Dict[str, Any],
+                                    fetched_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Normalize RentCast listing data to standard format.
+        
+        Args:
+            listing: Raw RentCast listing dictionary
+            fetched_at: ISO timestamp shared by the whole fetch; computed
+                per call when not given
+                
+        Returns:
+            Normalized listing dictionary
+        """
+        if fetched_at is None:
+            fetched_at = datetime.now().isoformat()
+        
+        # Straight-line lookups through a bound get are cheaper than a
+        # table-driven loop for a fixed set of fields
+        get = listing.get
         return {
             'source': 'rentcast',
-            'listing_id': str(listing.get('id', listing.get('listingId', ''))),
-            'property_id': str(listing.get('propertyId', listing.get('property_id', ''))),
-            'address': listing.get('address', listing.get('formattedAddress', '')),
-            'city': listing.get('city', ''),
-            'state': listing.get('state', ''),
-            'zip_code': listing.get('zipCode', listing.get('zip', '')),
-            'price': listing.get('price', listing.get('listPrice', listing.get('rent'))),
-            'bedrooms': listing.get('bedrooms', listing.get('beds')),
-            'bathrooms': listing.get('bathrooms', listing.get('baths')),
-            'square_feet': listing.get('squareFootage', listing.get('sqft')),
-            'lot_size': listing.get('lotSize'),
-            'year_built': listing.get('yearBuilt'),
-            'property_type': listing.get('propertyType', ''),
-            'listing_date': listing.get('listDate', listing.get('lastSeenDate')),
-            'listing_type': listing.get('listingType', 'unknown'),  # sale, rental, etc.
-            'status': listing.get('status', 'active'),
-            'days_on_market': listing.get('daysOnMarket'),
-            'mls_number': listing.get('mlsNumber', ''),
-            'url': listing.get('url', ''),
-            'latitude': listing.get('latitude', listing.get('lat')),
-            'longitude': listing.get('longitude', listing.get('lng')),
-            'fetched_at': datetime.now().isoformat()
+            'listing_id': str(get('id', get('listingId', ''))),
+            'property_id': str(get('propertyId', get('property_id', ''))),
+            'address': get('address', get('formattedAddress', '')),
+            'city': get('city', ''),
+            'state': get('state', ''),
+            'zip_code': get('zipCode', get('zip', '')),
+            'price': get('price', get('listPrice', get('rent'))),
+            'bedrooms': get('bedrooms', get('beds')),
+            'bathrooms': get('bathrooms', get('baths')),
+            'square_feet': get('squareFootage', get('sqft')),
+            'lot_size': get('lotSize'),
+            'year_built': get('yearBuilt'),
+            'property_type': get('propertyType', ''),
+            'listing_date': get('listDate', get('lastSeenDate')),
+            'listing_type': get('listingType', 'unknown'),  # sale, rental, etc.
+            'status': get('status', 'active'),
+            'days_on_market': get('daysOnMarket'),
+            'mls_number': get('mlsNumber', ''),
+            'url': get('url', ''),
+            'latitude': get('latitude', get('lat')),
+            'longitude': get('longitude', get('lng')),
+            'fetched_at': fetched_at
         }
     
+    @staticmethod
+    def _dedup_key(listing: Dict[str, Any]) -> str:
+        """
+        Build the identity key used to deduplicate a normalized listing.
+        
+        Prefers the listing ID, then the property ID, and falls back to the
+        lowercased address plus zip code when neither ID is present.
+        
+        Args:
+            listing: Normalized listing dictionary
+            
+        Returns:
+            Single string key for the listing
+        """
+        # Normalization stringifies missing IDs, so 'None' counts as absent
+        listing_id = listing.get('listing_id')
+        if listing_id and listing_id != 'None':
+            return f"l:{listing_id}"
+        property_id = listing.get('property_id')
+        if property_id and property_id != 'None':
+            return f"p:{property_id}"
+        return f"a:{(listing.get('address') or '').lower()}|{listing.get('zip_code') or ''}"
+    
     def _remove_duplicates(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate listings based on listing ID, address, or property ID."""
-        seen = set()
-        unique_listings = []
+        """Remove duplicate listings based on listing ID, property ID, or address."""
+        # A dict keeps the first listing per key in insertion order
+        unique_listings: Dict[str, Dict[str, Any]] = {}
+        dedup_key = self._dedup_key
         
         for listing in listings:
-            # Create a unique identifier using multiple possible keys
-            identifier = (
-                listing.get('listing_id', ''),
-                listing.get('address', '').lower(),
-                listing.get('city', '').lower(),
-                listing.get('zip_code', ''),
-                listing.get('property_id', '')
-            )
-            
-            if identifier not in seen:
-                seen.add(identifier)
-                unique_listings.append(listing)
+            key = dedup_key(listing)
+            if key not in unique_listings:
+                unique_listings[key] = listing
         
-        return unique_listings
+        return list(unique_listings.values())
     
     def _check_rate_limit(self, api_name: str) -> None:
-        """Check and enforce rate limits for API calls."""
-        now = time.time()
-        
-        if api_name not in self.rate_limits:
-            self.rate_limits[api_name] = {'calls': 0, 'reset_time': now + 60}
-        
-        rate_limit_info = self.rate_limits[api_name]
-        
-        # Reset counter if time window has passed
-        if now > rate_limit_info['reset_time']:
-            rate_limit_info['calls'] = 0
-            rate_limit_info['reset_time'] = now + 60
-        
-        # Check if we've hit the limit
-        max_calls = self.api_config.get(f'{api_name}_rate_limit', 60)  # Default 60 calls per minute
-        
-        if rate_limit_info['calls'] >= max_calls:
-            sleep_time = rate_limit_info['reset_time'] - now
-            logger.info(f"Rate limit reached for {api_name}, "
-                       f"sleeping for {sleep_time:.1f} seconds")
-            time.sleep(sleep_time)
-            rate_limit_info['calls'] = 0
-            rate_limit_info['reset_time'] = time.time() + 60
+        """
+        Block until the shared token bucket allows another API call.
         
-        rate_limit_info['calls'] += 1
+        Args:
+            api_name: Name of the API being called (all calls share one budget)
+        """
+        self._rate_limiter.wait_if_needed()
 
     # Paginated fetch methods
     
@@ -491,35 +962,26 @@ class RealEstateDataFetcher:
             APIResponse objects containing property data
         """
         logger.info("Starting paginated property fetch")
+        api_errors = _api_errors()
         
         try:
-            api_key = self.api_config.get('rentcast_api_key')
-            if not api_key:
-                logger.warning("RentCast API key not configured")
+            client = self._get_client()
+            if client is None or not self._connection_ok(client):
                 return
             
-            endpoint = self.api_config.get('rentcast_endpoint', 'https://api.rentcast.io/v1')
-            rate_limit = self.api_config.get('rentcast_rate_limit', 100)
-            
-            # Initialize RentCast client
-            with RentCastClient(
-                api_key=api_key,
-                base_url=endpoint,
-                rate_limit=rate_limit
-            ) as client:
-                
-                # Test connection first
-                if not client.test_connection():
-                    logger.error("RentCast API connection test failed")
-                    return
-                
-                # Use pagination manager to fetch properties
-                yield from self.pagination_manager.paginate_request(
+            # Use pagination manager to fetch properties, prefetching ahead of
+            # the caller; each page received also refreshes the probe
+            for page in self.pagination_manager.prefetch_pages(
+                self.pagination_manager.paginate_request(
                     client, 'properties', search_params, max_pages
                 )
-                
-        except Exception as e:
-            logger.error(f"Error in paginated property fetch: {str(e)}")
+            ):
+                self._mark_connection_ok()
+                yield page
+            
+        except api_errors as e:
+            logger.error(f"Error in paginated property fetch: {type(e).__name__}: {str(e)}")
+            logger.debug("Paginated property fetch error details", exc_info=True)
     
     def fetch_listings_paginated(self, search_params: Dict[str, Any],
                                 listing_type: str = 'sale',
@@ -536,44 +998,82 @@ class RealEstateDataFetcher:
             APIResponse objects containing listing data
         """
         logger.info(f"Starting paginated {listing_type} listing fetch")
+        api_errors = _api_errors()
         
         try:
-            api_key = self.api_config.get('rentcast_api_key')
-            if not api_key:
-                logger.warning("RentCast API key not configured")
+            client = self._get_client()
+            if client is None or not self._connection_ok(client):
                 return
             
-            endpoint = self.api_config.get('rentcast_endpoint', 'https://api.rentcast.io/v1')
-            rate_limit = self.api_config.get('rentcast_rate_limit', 100)
+            # Determine endpoint based on listing type
+            endpoint_name = _LISTING_ENDPOINTS.get(listing_type.casefold())
+            if endpoint_name is None:
+                logger.error(f"Unknown listing type: {listing_type}")
+                return
             
-            # Initialize RentCast client
-            with RentCastClient(
-                api_key=api_key,
-                base_url=endpoint,
-                rate_limit=rate_limit
-            ) as client:
-                
-                # Test connection first
-                if not client.test_connection():
-                    logger.error("RentCast API connection test failed")
-                    return
-                
-                # Determine endpoint based on listing type
-                if listing_type.lower() == 'sale':
-                    endpoint_name = 'listings_sale'
-                elif listing_type.lower() in ['rental', 'rent']:
-                    endpoint_name = 'listings_rental_long_term'
-                else:
-                    logger.error(f"Unknown listing type: {listing_type}")
-                    return
-                
-                # Use pagination manager to fetch listings
-                yield from self.pagination_manager.paginate_request(
+            # Use pagination manager to fetch listings, prefetching ahead of
+            # the caller; each page received also refreshes the probe
+            for page in self.pagination_manager.prefetch_pages(
+                self.pagination_manager.paginate_request(
                     client, endpoint_name, search_params, max_pages
                 )
-                
-        except Exception as e:
-            logger.error(f"Error in paginated listing fetch: {str(e)}")
+            ):
+                self._mark_connection_ok()
+                yield page
+            
+        except api_errors as e:
+            logger.error(f"Error in paginated listing fetch: {type(e).__name__}: {str(e)}")
+            logger.debug("Paginated listing fetch error details", exc_info=True)
+    
+    @staticmethod
+    def _log_page_progress(pages: Generator[APIResponse, None, None],
+                           label: str) -> Generator[APIResponse, None, None]:
+        """Pass pages through unchanged, logging a running total at DEBUG level."""
+        total = 0
+        for page in pages:
+            total += len(page.data)
+            logger.debug("Collected %d %s from page, total so far: %d",
+                         len(page.data), label, total)
+            yield page
+    
+    def iter_all_properties_paginated(self, search_params: Dict[str, Any],
+                                      max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all properties across pages without materializing them.
+        
+        Only the pages currently buffered are held in memory, so callers
+        writing to a database or file can stream arbitrarily large results.
+        
+        Args:
+            search_params: Search parameters for properties
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            Iterator over property dictionaries
+        """
+        pages = self.fetch_properties_paginated(search_params, max_pages)
+        if logger.isEnabledFor(logging.DEBUG):
+            pages = self._log_page_progress(pages, 'properties')
+        return chain.from_iterable(page.data for page in pages)
+    
+    def iter_all_listings_paginated(self, search_params: Dict[str, Any],
+                                    listing_type: str = 'sale',
+                                    max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all listings across pages without materializing them.
+        
+        Args:
+            search_params: Search parameters for listings
+            listing_type: Type of listings ('sale' or 'rental')
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            Iterator over listing dictionaries
+        """
+        pages = self.fetch_listings_paginated(search_params, listing_type, max_pages)
+        if logger.isEnabledFor(logging.DEBUG):
+            pages = self._log_page_progress(pages, 'listings')
+        return chain.from_iterable(page.data for page in pages)
     
     def fetch_all_properties_paginated(self, search_params: Dict[str, Any],
                                       max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -587,12 +1087,7 @@ class RealEstateDataFetcher:
         Returns:
             Combined list of all property data
         """
-        all_properties = []
-        
-        for response in self.fetch_properties_paginated(search_params, max_pages):
-            all_properties.extend(response.data)
-            logger.info(f"Collected {len(response.data)} properties from page, "
-                       f"total so far: {len(all_properties)}")
+        all_properties = list(self.iter_all_properties_paginated(search_params, max_pages))
         
         logger.info(f"Paginated fetch complete. Total properties: {len(all_properties)}")
         return all_properties
@@ -611,19 +1106,64 @@ class RealEstateDataFetcher:
         Returns:
             Combined list of all listing data
         """
-        all_listings = []
-        
-        for response in self.fetch_listings_paginated(search_params, listing_type, max_pages):
-            all_listings.extend(response.data)
-            logger.info(f"Collected {len(response.data)} listings from page, "
-                       f"total so far: {len(all_listings)}")
+        all_listings = list(self.iter_all_listings_paginated(search_params, listing_type,
+                                                             max_pages))
         
         logger.info(f"Paginated fetch complete. Total listings: {len(all_listings)}")
         return all_listings
     
+    def fetch_all_properties_paginated_df(self, search_params: Dict[str, Any],
+                                         max_pages: Optional[int] = None) -> 'pd.DataFrame':
+        """
+        Fetch all properties using pagination and return them as a DataFrame.
+        
+        Each page is converted to columnar form as it arrives, so numeric
+        fields end up in typed column buffers rather than boxed per-row values.
+        
+        Args:
+            search_params: Search parameters for properties
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            DataFrame with one row per property
+        """
+        return self._pages_to_dataframe(self.fetch_properties_paginated(search_params, max_pages))
+    
+    def fetch_all_listings_paginated_df(self, search_params: Dict[str, Any],
+                                       listing_type: str = 'sale',
+                                       max_pages: Optional[int] = None) -> 'pd.DataFrame':
+        """
+        Fetch all listings using pagination and return them as a DataFrame.
+        
+        Args:
+            search_params: Search parameters for listings
+            listing_type: Type of listings ('sale' or 'rental')
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            DataFrame with one row per listing
+        """
+        return self._pages_to_dataframe(
+            self.fetch_listings_paginated(search_params, listing_type, max_pages)
+        )
+    
+    @staticmethod
+    def _pages_to_dataframe(pages: Generator[APIResponse, None, None]) -> 'pd.DataFrame':
+        """Build one DataFrame from per-page record frames."""
+        import pandas as pd
+        
+        frames = [pd.DataFrame.from_records(page.data) for page in pages if page.data]
+        if not frames:
+            return pd.DataFrame()
+        
+        all_records = pd.concat(frames, copy=False, ignore_index=True)
+        logger.info(f"Paginated fetch complete. Total rows: {len(all_records)}")
+        return all_records
+    
     # === STRUCTURED SEARCH METHODS ===
     
-    def search_properties_structured(self, search_criteria: SearchCriteria) -> List[Dict[str, Any]]:
+    def search_properties_structured(self,
+                                     search_criteria: 'SearchCriteria') -> List[Dict[str, Any]]:
         """
         Search for properties using structured search criteria.
         
@@ -633,46 +1173,40 @@ class RealEstateDataFetcher:
         Returns:
             List of property dictionaries matching the criteria
         """
-        logger.info(f"Starting structured property search")
-        logger.info(f"Search type: {getattr(search_criteria, 'search_type', 'Unknown')}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Starting structured property search")
+            logger.info(f"Search type: {search_criteria.search_type}")
+        
+        cache_key = self._search_cache_key('properties', search_criteria)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            logger.info(f"Found {len(cached)} properties (cached)")
+            return cached
+        
+        client = self._get_client()
+        if client is None or not self._connection_ok(client):
+            return []
         
         try:
-            api_key = self.api_config.get('rentcast_api_key')
-            if not api_key:
-                logger.warning("RentCast API key not configured")
-                return []
-            
-            endpoint = self.api_config.get('rentcast_endpoint', 'https://api.rentcast.io/v1')
-            rate_limit = self.api_config.get('rentcast_rate_limit', 100)
-            
-            # Initialize RentCast client
-            with RentCastClient(
-                api_key=api_key,
-                base_url=endpoint,
-                rate_limit=rate_limit
-            ) as client:
-                
-                # Test connection first
-                if not client.test_connection():
-                    logger.error("RentCast API connection test failed")
-                    return []
-                
-                # Use structured search
-                response = client.search_properties_structured(search_criteria)
-                
-                if hasattr(response, 'properties') and response.properties:
-                    properties = [prop.to_dict() for prop in response.properties]
-                    logger.info(f"Found {len(properties)} properties")
-                    return properties
-                else:
-                    logger.info("No properties found matching criteria")
-                    return []
-                    
-        except Exception as e:
+            # Use structured search
+            response = client.search_properties_structured(search_criteria)
+        except _api_errors() as e:
             logger.error(f"Error in structured property search: {str(e)}")
             return []
+        self._mark_connection_ok()
+        
+        if response.properties:
+            # The response keeps the API's own record dicts; no per-property to_dict()
+            properties = _response_records(response, response.properties)
+            logger.info(f"Found {len(properties)} properties")
+        else:
+            logger.info("No properties found matching criteria")
+            properties = []
+        
+        self._cache_search(cache_key, properties, self._property_cache_ttl)
+        return properties
     
-    def search_listings_structured(self, search_criteria: SearchCriteria,
+    def search_listings_structured(self, search_criteria: 'SearchCriteria',
                                   listing_type: str = 'sale') -> List[Dict[str, Any]]:
         """
         Search for listings using structured search criteria.
@@ -684,47 +1218,61 @@ class RealEstateDataFetcher:
         Returns:
             List of listing dictionaries matching the criteria
         """
-        logger.info(f"Starting structured {listing_type} listing search")
-        logger.info(f"Search type: {getattr(search_criteria, 'search_type', 'Unknown')}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Starting structured {listing_type} listing search")
+            logger.info(f"Search type: {search_criteria.search_type}")
+        
+        # Use structured search based on listing type
+        endpoint_name = _LISTING_ENDPOINTS.get(listing_type.casefold())
+        if endpoint_name is None:
+            logger.error(f"Unknown listing type: {listing_type}")
+            return []
+        
+        cache_key = self._search_cache_key(endpoint_name, search_criteria)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            logger.info(f"Found {len(cached)} {listing_type} listings (cached)")
+            return cached
+        
+        client = self._get_client()
+        if client is None or not self._connection_ok(client):
+            return []
         
         try:
-            api_key = self.api_config.get('rentcast_api_key')
-            if not api_key:
-                logger.warning("RentCast API key not configured")
-                return []
-            
-            endpoint = self.api_config.get('rentcast_endpoint', 'https://api.rentcast.io/v1')
-            rate_limit = self.api_config.get('rentcast_rate_limit', 100)
-            
-            # Initialize RentCast client
-            with RentCastClient(
-                api_key=api_key,
-                base_url=endpoint,
-                rate_limit=rate_limit
-            ) as client:
-                
-                # Test connection first
-                if not client.test_connection():
-                    logger.error("RentCast API connection test failed")
-                    return []
-                
-                # Use structured search based on listing type
-                if listing_type.lower() == 'sale':
-                    response_data = client.search_listings_sale_structured(search_criteria)
-                elif listing_type.lower() in ['rental', 'rent']:
-                    response_data = client.search_listings_rental_structured(search_criteria)
-                else:
-                    logger.error(f"Unknown listing type: {listing_type}")
-                    return []
-                
-                # Extract listings from response
-                listings = response_data.get('listings', [])
-                logger.info(f"Found {len(listings)} {listing_type} listings")
-                return listings
-                    
-        except Exception as e:
+            search = getattr(client, _STRUCTURED_LISTING_METHODS[endpoint_name])
+            response_data = search(search_criteria)
+        except _api_errors() as e:
             logger.error(f"Error in structured {listing_type} listing search: {str(e)}")
             return []
+        self._mark_connection_ok()
+        
+        # Extract listings from response
+        listings = response_data.get('listings', [])
+        logger.info(f"Found {len(listings)} {listing_type} listings")
+        self._cache_search(cache_key, listings, self._listing_cache_ttl)
+        return listings
+    
+    def iter_listings_structured(self, search_criteria: 'SearchCriteria',
+                                 listing_type: str = 'sale',
+                                 max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all listings matching structured criteria, page by page.
+        
+        Unlike search_listings_structured, this follows pagination past the
+        first page and never materializes the full result set: only the
+        prefetched pages are held in memory. Results are not cached.
+        
+        Args:
+            search_criteria: Structured search criteria object (its limit, if
+                set, is used as the page size)
+            listing_type: Type of listings ('sale' or 'rental')
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            Iterator over listing dictionaries
+        """
+        return self.iter_all_listings_paginated(search_criteria.to_query_params(),
+                                                listing_type, max_pages)
     
     # === CONVENIENCE SEARCH METHODS ===
     
@@ -732,6 +1280,9 @@ class RealEstateDataFetcher:
         """
         Search for a specific property by address.
         
+        Non-empty results are cached by normalized address and criteria, so
+        repeated lookups of the same address skip the API round-trip.
+        
         Args:
             address: Full property address (Street, City, State, Zip format recommended)
             **kwargs: Additional search criteria
@@ -739,8 +1290,190 @@ class RealEstateDataFetcher:
         Returns:
             List of property dictionaries (typically one property)
         """
-        search_criteria = search_by_address(address, **kwargs)
-        return self.search_properties_structured(search_criteria)
+        cache_key = self._address_cache_key(address, kwargs)
+        cached = self._get_cached_address(cache_key)
+        if cached is not None:
+            return cached
+        
+        search_criteria = _cached_criteria(_build_address_criteria, address, **kwargs)
+        properties = self.search_properties_structured(search_criteria)
+        self._cache_address(cache_key, properties)
+        return properties
+    
+    def search_by_addresses_bulk(self, addresses: List[str],
+                                 **kwargs) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several specific properties by address concurrently.
+        
+        Cached addresses are answered without a request, and an address that
+        appears more than once (after normalization) is searched only once.
+        
+        Args:
+            addresses: Full property addresses to look up
+            **kwargs: Additional search criteria applied to every address
+            
+        Returns:
+            One list of property dictionaries per address, in input order
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = []
+        # Input positions waiting on each distinct uncached address
+        misses: Dict[Any, List[int]] = {}
+        for index, address in enumerate(addresses):
+            cache_key = self._address_cache_key(address, kwargs)
+            cached = self._get_cached_address(cache_key)
+            results.append(cached)
+            if cached is None:
+                # Unhashable kwargs give no key; search those positions individually
+                misses.setdefault(cache_key if cache_key is not None else index, []).append(index)
+        
+        # Only the distinct addresses not already cached hit the API
+        waiting = list(misses.items())
+        criteria_list = [_cached_criteria(_build_address_criteria, addresses[indexes[0]], **kwargs)
+                         for _, indexes in waiting]
+        for (cache_key, indexes), properties in zip(waiting, self.search_many(criteria_list)):
+            if isinstance(cache_key, tuple):
+                self._cache_address(cache_key, properties)
+            results[indexes[0]] = properties
+            for index in indexes[1:]:
+                results[index] = list(properties)
+        
+        return results
+    
+    def _search_cache_key(self, kind: str, search_criteria: 'SearchCriteria') -> Optional[str]:
+        """
+        Get the persistent cache key for a structured search.
+        
+        Args:
+            kind: 'properties' or the listings endpoint name
+            search_criteria: Structured search criteria object
+            
+        Returns:
+            Cache key, or None when the search cache is disabled
+        """
+        if self._search_cache is None:
+            return None
+        from .search_cache import SearchCache
+        return SearchCache.make_key(kind, search_criteria)
+    
+    def _get_cached_search(self, cache_key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Get a cached structured search result, if caching is enabled and it is fresh."""
+        if cache_key is None or self._search_cache is None:
+            return None
+        return self._search_cache.get(cache_key)
+    
+    def _cache_search(self, cache_key: Optional[str], results: List[Dict[str, Any]],
+                      ttl: float) -> None:
+        """Store a structured search result, if caching is enabled."""
+        if cache_key is not None and self._search_cache is not None:
+            self._search_cache.set(cache_key, results, ttl)
+    
+    def invalidate_search(self, search_criteria: 'SearchCriteria',
+                          listing_type: Optional[str] = None) -> None:
+        """
+        Drop a cached structured search so the next call refetches it.
+        
+        Args:
+            search_criteria: Criteria of the cached search
+            listing_type: Listing type of a listing search ('sale' or 'rental');
+                None for a property search
+        """
+        if self._search_cache is None:
+            return
+        
+        kind = 'properties'
+        if listing_type is not None:
+            kind = _LISTING_ENDPOINTS.get(listing_type.casefold(), listing_type)
+        self._search_cache.delete(self._search_cache_key(kind, search_criteria))
+    
+    @staticmethod
+    def _address_cache_key(address: str, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Build a cache key from a normalized address and search kwargs (None if unhashable)."""
+        normalized_address = ' '.join(address.upper().split())
+        cache_key = (normalized_address, tuple(sorted(kwargs.items())))
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+    
+    def _get_cached_address(self, cache_key: Optional[tuple]) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for an address search key, or None on a miss."""
+        if cache_key is None:
+            return None
+        
+        with self._address_cache_lock:
+            properties = self._address_cache.get(cache_key)
+            if properties is None:
+                return None
+            self._address_cache.move_to_end(cache_key)
+            return list(properties)
+    
+    def _cache_address(self, cache_key: Optional[tuple],
+                       properties: List[Dict[str, Any]]) -> None:
+        """Store non-empty address search results, evicting the least recently used."""
+        if cache_key is None or not properties or self._address_cache_size <= 0:
+            return
+        
+        with self._address_cache_lock:
+            self._address_cache[cache_key] = list(properties)
+            self._address_cache.move_to_end(cache_key)
+            while len(self._address_cache) > self._address_cache_size:
+                self._address_cache.popitem(last=False)
+    
+    def clear_address_cache(self) -> None:
+        """Clear cached address search results."""
+        with self._address_cache_lock:
+            self._address_cache.clear()
+    
+    def search_many(self, criteria_list: List['SearchCriteria']) -> List[List[Dict[str, Any]]]:
+        """
+        Run several structured property searches concurrently.
+        
+        The searches share the pooled client and its rate limiter, so a batch
+        takes roughly as long as its slowest request rather than the sum of
+        all of them, up to the configured rate limit.
+        
+        Args:
+            criteria_list: Structured search criteria objects
+            
+        Returns:
+            One list of property dictionaries per criteria, in input order
+        """
+        if not criteria_list:
+            return []
+        
+        max_workers = min(self._search_workers, len(criteria_list))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.search_properties_structured, criteria_list))
+    
+    async def asearch_properties_structured(self, search_criteria: 'SearchCriteria'
+                                            ) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_properties_structured for use inside event loops.
+        
+        The blocking search runs in a worker thread so the event loop stays
+        responsive; gather several of these to run searches concurrently.
+        
+        Args:
+            search_criteria: Structured search criteria object
+            
+        Returns:
+            List of property dictionaries matching the criteria
+        """
+        return await asyncio.to_thread(self.search_properties_structured, search_criteria)
+    
+    async def asearch_many(self, criteria_list: List['SearchCriteria']
+                           ) -> List[List[Dict[str, Any]]]:
+        """
+        Async variant of search_many.
+        
+        Args:
+            criteria_list: Structured search criteria objects
+            
+        Returns:
+            One list of property dictionaries per criteria, in input order
+        """
+        return await asyncio.to_thread(self.search_many, criteria_list)
     
     def search_by_location(self, city: Optional[str] = None,
                           state: Optional[str] = None,
@@ -758,8 +1491,8 @@ class RealEstateDataFetcher:
         Returns:
             List of property dictionaries matching the location
         """
-        search_criteria = search_by_location(city=city, state=state,
-                                             zip_code=zip_code, **kwargs)
+        search_criteria = _cached_criteria(_build_location_criteria, city, state, zip_code,
+                                           **kwargs)
         return self.search_properties_structured(search_criteria)
     
     def search_by_coordinates(self, latitude: float, longitude: float,
@@ -768,6 +1501,14 @@ class RealEstateDataFetcher:
         """
         Search for properties within a radius of coordinates.
         
+        The search is snapped to a coarse grid (see ``_quantize_coordinates``)
+        so near-identical calls, such as a dragged map, share one cached
+        response; results are then filtered back to the exact radius.
+        Properties without coordinates can't be filtered and are kept, as
+        the exact search would return them. If the wider snapped search
+        fills its result limit, it may have crowded out properties inside
+        the exact radius, so the exact search is run instead.
+        
         Args:
             latitude: Center latitude
             longitude: Center longitude
@@ -777,10 +1518,83 @@ class RealEstateDataFetcher:
         Returns:
             List of property dictionaries within the radius
         """
-        search_criteria = search_by_coordinates(latitude=latitude,
-                                               longitude=longitude,
-                                               radius=radius, **kwargs)
-        return self.search_properties_structured(search_criteria)
+        grid_latitude, grid_longitude, grid_radius = _quantize_coordinates(latitude, longitude,
+                                                                           radius)
+        search_criteria = _cached_criteria(_build_coordinates_criteria, grid_latitude,
+                                           grid_longitude, grid_radius, **kwargs)
+        properties = self.search_properties_structured(search_criteria)
+        
+        if (grid_latitude, grid_longitude, grid_radius) == (latitude, longitude, radius):
+            return properties
+        
+        if len(properties) >= (kwargs.get('limit') or _API_DEFAULT_LIMIT):
+            logger.info("Snapped coordinate search reached its result limit, "
+                        "searching the exact radius")
+            return self.search_properties_structured(
+                _cached_criteria(_build_coordinates_criteria, latitude, longitude, radius,
+                                 **kwargs))
+
+        
+        return [prop for prop in properties
+                if prop.get('latitude') is None or prop.get('longitude') is None
+                or _distance_miles(latitude, longitude,
+                                   prop['latitude'], prop['longitude']) <= radius]
+    
+    def search_by_coordinates_bulk(self, points: List[Tuple[float, float, float]],
+                                   **kwargs) -> List[List[Dict[str, Any]]]:
+        """
+        Search around several nearby coordinates with as few API requests as possible.
+        
+        Nearby points are coalesced into one radius search that covers all of
+        them, and each point's results are then filtered locally by distance.
+        Points are searched individually when the covering radius would exceed
+        ``coordinate_coalesce_max_radius`` miles or the combined search fills
+        its result limit (so results may have been truncated).
+        
+        Args:
+            points: (latitude, longitude, radius in miles) tuples
+            **kwargs: Additional search criteria applied to every point
+            
+        Returns:
+            One list of property dictionaries per point, in input order
+        """
+        from ..search.search_queries import search_by_coordinates
+        
+        if not points:
+            return []
+        
+        center_latitude = (min(p[0] for p in points) + max(p[0] for p in points)) / 2
+        center_longitude = (min(p[1] for p in points) + max(p[1] for p in points)) / 2
+        combined_radius = max(
+            _distance_miles(center_latitude, center_longitude, latitude, longitude) + radius
+            for latitude, longitude, radius in points
+        )
+        
+        if len(points) > 1 and combined_radius <= self._coalesce_max_radius:
+            limit = kwargs.get('limit') or 500
+            search_criteria = search_by_coordinates(latitude=center_latitude,
+                                                   longitude=center_longitude,
+                                                   radius=combined_radius,
+                                                   **{**kwargs, 'limit': limit})
+            properties = self.search_properties_structured(search_criteria)
+            
+            if len(properties) < limit:
+                logger.info(f"Coalesced {len(points)} coordinate searches into one request")
+                return [
+                    [prop for prop in properties
+                     if prop.get('latitude') is not None and prop.get('longitude') is not None
+                     and _distance_miles(latitude, longitude,
+                                         prop['latitude'], prop['longitude']) <= radius]
+                    for latitude, longitude, radius in points
+                ]
+            
+            logger.info("Combined coordinate search reached its result limit, "
+                        "searching points individually")
+        
+        criteria_list = [_cached_criteria(_build_coordinates_criteria, latitude, longitude,
+                                          radius, **kwargs)
+                         for latitude, longitude, radius in points]
+        return self.search_many(criteria_list)
     
     def search_around_address(self, address: str, radius: float = 5.0,
                              **kwargs) -> List[Dict[str, Any]]:
@@ -795,19 +1609,23 @@ class RealEstateDataFetcher:
         Returns:
             List of property dictionaries within the radius
         """
+        from ..search.search_queries import search_around_address
+        
         search_criteria = search_around_address(address=address, radius=radius, **kwargs)
         return self.search_properties_structured(search_criteria)
     
-    def create_search_builder(self) -> SearchQueryBuilder:
+    def create_search_builder(self) -> 'SearchQueryBuilder':
         """
         Create a new search query builder for constructing complex searches.
         
         Returns:
             SearchQueryBuilder instance for method chaining
         """
+        from ..search.search_queries import SearchQueryBuilder
+        
         return SearchQueryBuilder()
     
-    def search_with_builder(self, builder: SearchQueryBuilder) -> List[Dict[str, Any]]:
+    def search_with_builder(self, builder: 'SearchQueryBuilder') -> List[Dict[str, Any]]:
         """
         Execute a search using a search query builder.
         
@@ -9,19 +9,929 @@ Includes comprehensive pagination support for handling large datasets.
 import json
 import logging
 import sqlite3
+import threading
+import weakref
+import zlib
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library codec
+    orjson = None
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime; only analytics_query() needs it
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
+# Per-connection tuning: fewer fsyncs (safe with WAL), in-memory temp
+# b-trees for sorts/indexes, a 64 MB page cache (negative = KiB), and up
+# to 1 GiB of the file memory-mapped so reads come straight from the OS
+# page cache instead of a read() call per page
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA mmap_size = 1073741824',
+)
+
+# Upsert statements for the bulk saves, kept as constants so the identical
+# SQL string hits the connection's statement cache on every call
+_INSERT_PROPERTY_SQL = '''
+    INSERT OR REPLACE INTO properties
+    (property_id, source, address, city, state, zip_code, price,
+     bedrooms, bathrooms, square_feet, lot_size, year_built,
+     property_type, listing_date, days_on_market, url,
+     latitude, longitude, description, fetched_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_LISTING_SQL = '''
+    INSERT OR REPLACE INTO listings
+    (listing_id, property_id, source, listing_type, address, city, state, zip_code, price,
+     bedrooms, bathrooms, square_feet, lot_size, year_built,
+     property_type, listing_date, days_on_market, status, url,
+     latitude, longitude, description, fetched_at, updated_at, mls_number)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# The full API record of each row lives in a narrow sidecar table keyed by
+# the row's natural id, so scans of the main tables never page it in
+_INSERT_PROPERTY_RAW_SQL = ('INSERT OR REPLACE INTO properties_raw (property_id, raw_data) '
+                            'VALUES (?, ?)')
+
+_INSERT_LISTING_RAW_SQL = 'INSERT OR REPLACE INTO listings_raw (listing_id, raw_data) VALUES (?, ?)'
+
+# Rebuilds the per-city rollup behind get_city_statistics(). Counts and
+# sums are stored instead of averages so each average is exact (sum / n
+# over non-NULL values, as AVG() computes it).
+_REFRESH_CITY_STATS_SQL = '''
+    INSERT INTO city_stats_mv
+    (city, property_count, n_price, sum_price, min_price, max_price,
+     n_sqft, sum_sqft, n_dom, sum_dom, updated_at)
+    SELECT city, COUNT(*), COUNT(price), TOTAL(price), MIN(price), MAX(price),
+           COUNT(square_feet), TOTAL(square_feet), COUNT(days_on_market), TOTAL(days_on_market), ?
+    FROM properties
+    WHERE city IS NOT NULL AND city != ''
+    GROUP BY city
+'''
+
+# Sidecar table and join key for each table with raw_data
+_RAW_TABLES = {
+    'properties': ('properties_raw', 'property_id'),
+    'listings': ('listings_raw', 'listing_id'),
+}
+
+# Secondary indexes on properties, by name. bulk_save_properties() drops
+# and rebuilds these around large loads; the UNIQUE property_id index that
+# INSERT OR REPLACE relies on is not among them.
+_PROPERTY_INDEXES = {
+    # (city, price) serves city filters, city + price-range criteria
+    # searches and per-city price aggregates
+    'idx_properties_city_price': 'properties(city, price)',
+    # Price ranges, with bedrooms in the index so criteria searches on
+    # both filter bedrooms without reading the rows
+    'idx_properties_price_beds': 'properties(price, bedrooms)',
+    'idx_properties_listing_date': 'properties(listing_date)',
+    # Recent-first ordering and keyset seeks on fetch time; also serves
+    # plain fetched_at range filters
+    'idx_properties_fetched_id': 'properties(fetched_at DESC, id DESC)',
+    # Newest-first ordering and keyset seeks for paginated reads
+    'idx_properties_created_id': 'properties(created_at DESC, id DESC)',
+}
+
+# Columns returned by property and listing reads. raw_data (the full API
+# record, often kilobytes of JSON) is only read and decoded on request.
+_PROPERTY_COLUMNS = (
+    'id', 'property_id', 'source', 'address', 'city', 'state', 'zip_code', 'price',
+    'bedrooms', 'bathrooms', 'square_feet', 'lot_size', 'year_built', 'property_type',
+    'listing_date', 'days_on_market', 'url', 'latitude', 'longitude', 'description',
+    'fetched_at', 'created_at', 'updated_at',
+)
+
+_LISTING_COLUMNS = (
+    'id', 'listing_id', 'property_id', 'source', 'listing_type', 'address', 'city', 'state',
+    'zip_code', 'price', 'bedrooms', 'bathrooms', 'square_feet', 'lot_size', 'year_built',
+    'property_type', 'listing_date', 'days_on_market', 'status', 'url', 'latitude', 'longitude',
+    'description', 'fetched_at', 'created_at', 'updated_at', 'mls_number',
+)
+
+
+# Compact projection for list views, for use as the ``columns`` argument
+PROPERTY_LIST_COLUMNS = ('id', 'address', 'city', 'price', 'bedrooms', 'bathrooms', 'square_feet')
+
+# Columns returned by the AVM, market statistics and comparables reads. Each
+# table's raw JSON column is only read and decoded on request.
+_AVM_COLUMNS = (
+    'id', 'property_id', 'address', 'estimated_value', 'estimated_rent', 'confidence_score',
+    'value_range_low', 'value_range_high', 'rent_range_low', 'rent_range_high',
+    'comparables_count', 'cap_rate', 'cash_flow', 'roi_percentage',
+    'fetched_at', 'created_at', 'updated_at',
+)
+
+_MARKET_COLUMNS = (
+    'id', 'zip_code', 'city', 'state', 'property_type', 'bedrooms', 'avg_sale_price',
+    'median_sale_price', 'avg_rent_price', 'median_rent_price', 'avg_price_per_sqft',
+    'avg_rent_per_sqft', 'inventory_count', 'avg_days_on_market', 'rent_yield_percentage',
+    'price_trend_3m', 'price_trend_6m', 'price_trend_12m', 'analysis_month',
+    'fetched_at', 'created_at',
+)
+
+_COMPARABLE_COLUMNS = (
+    'id', 'source_property_id', 'comparable_property_id', 'comparable_address', 'sale_price',
+    'sale_date', 'distance_miles', 'bedrooms', 'bathrooms', 'square_feet', 'price_per_sqft',
+    'days_on_market', 'similarity_score', 'created_at',
+)
+
+
+def _select_variants(columns: Tuple[str, ...], raw_column: str, rest: str) -> Dict[bool, str]:
+    """Build a SELECT without and with its raw JSON column, keyed by include_raw."""
+    return {
+        include_raw: f"SELECT {', '.join(columns + ((raw_column,) if include_raw else ()))} {rest}"
+        for include_raw in (False, True)
+    }
+
+
+_SELECT_AVM_SQL = _select_variants(
+    _AVM_COLUMNS, 'raw_avm_data',
+    'FROM avm_valuations WHERE property_id = ? ORDER BY fetched_at DESC LIMIT 1')
+
+# Filters and ordering are appended per call
+_SELECT_MARKET_SQL = _select_variants(
+    _MARKET_COLUMNS, 'raw_market_data', 'FROM market_statistics WHERE zip_code = ?')
+
+_SELECT_COMPARABLES_SQL = _select_variants(
+    _COMPARABLE_COLUMNS, 'raw_comparable_data',
+    'FROM property_comparables WHERE source_property_id = ? ORDER BY similarity_score DESC LIMIT ?')
+
+
+# Tables counted by get_database_stats, in the order the counts are reported
+_STATS_TABLES = (
+    'properties', 'analysis_results', 'notifications_log',
+    'avm_valuations', 'market_statistics', 'property_comparables',
+    'investment_analysis', 'price_history', 'deal_analyses', 'deal_insights'
+)
+
+# Tables whose date range get_database_stats reports, with the column used
+_STATS_DATE_COLUMNS = {
+    'properties': 'created_at',
+    'avm_valuations': 'fetched_at',
+    'market_statistics': 'fetched_at',
+}
+
+# Statements for the analysis, valuation and notification saves and reads,
+# kept as constants alongside the property ones above
+_INSERT_ANALYSIS_RESULT_SQL = '''
+    INSERT INTO analysis_results (analysis_type, results)
+    VALUES (?, ?)
+'''
+
+_INSERT_AVM_SQL = '''
+    INSERT OR REPLACE INTO avm_valuations
+    (property_id, address, estimated_value, estimated_rent, confidence_score,
+     value_range_low, value_range_high, rent_range_low, rent_range_high,
+     comparables_count, cap_rate, cash_flow, roi_percentage, raw_avm_data,
+     fetched_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Parameters are numbered so rent_yield_percentage can be computed from
+# the bound sale (?6) and rent (?8) averages instead of being passed in
+_INSERT_MARKET_STATISTICS_SQL = '''
+    INSERT OR REPLACE INTO market_statistics
+    (zip_code, city, state, property_type, bedrooms,
+     avg_sale_price, median_sale_price, avg_rent_price, median_rent_price,
+     avg_price_per_sqft, avg_rent_per_sqft, inventory_count,
+     avg_days_on_market, rent_yield_percentage,
+     price_trend_3m, price_trend_6m, price_trend_12m,
+     raw_market_data, analysis_month, fetched_at)
+    VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13,
+            CASE WHEN ?6 THEN COALESCE(?8, 0) * 12.0 / ?6 * 100 END,
+            ?14, ?15, ?16, ?17, ?18, ?19)
+'''
+
+_INSERT_COMPARABLE_SQL = '''
+    INSERT OR REPLACE INTO property_comparables
+    (source_property_id, comparable_property_id, comparable_address,
+     sale_price, sale_date, distance_miles, bedrooms, bathrooms,
+     square_feet, price_per_sqft, days_on_market, similarity_score,
+     raw_comparable_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_INVESTMENT_SQL = '''
+    INSERT OR REPLACE INTO investment_analysis
+    (property_id, purchase_price, estimated_rent, estimated_expenses,
+     cap_rate, cash_on_cash_return, gross_yield, net_yield,
+     monthly_cash_flow, annual_cash_flow, break_even_ratio,
+     investment_score, risk_level, analysis_notes, analysis_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_PRICE_HISTORY_SQL = '''
+    INSERT INTO price_history
+    (property_id, price, price_type, date_recorded, source, notes)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_NOTIFICATION_SQL = '''
+    INSERT INTO notifications_log
+    (notification_type, recipient, subject, status, property_count)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_INSERT_DEAL_ANALYSIS_SQL = '''
+    INSERT OR REPLACE INTO deal_analyses
+    (analysis_id, property_address, property_data, avm_data,
+     market_data, deal_score_data, analysis_timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_DEAL_INSIGHT_SQL = '''
+    INSERT OR REPLACE INTO deal_insights
+    (analysis_id, property_address, zip_code, property_type, bedrooms, bathrooms,
+     square_footage, asking_price, estimated_value, overall_score, deal_type,
+     confidence, value_discount_pct, analysis_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SELECT_INVESTMENT_SQL = '''
+    SELECT * FROM investment_analysis
+    WHERE property_id = ?
+    ORDER BY analysis_date DESC LIMIT 1
+'''
+
+_SELECT_PRICE_HISTORY_SQL = '''
+    SELECT * FROM price_history
+    WHERE property_id = ?
+    ORDER BY date_recorded DESC
+'''
+
+_SELECT_TOP_INVESTMENTS_SQL = '''
+    SELECT ia.*, p.address, p.city, p.state, p.price, p.bedrooms, p.bathrooms,
+           av.estimated_value, av.confidence_score
+    FROM investment_analysis ia
+    JOIN properties p ON ia.property_id = p.property_id
+    LEFT JOIN avm_valuations av ON ia.property_id = av.property_id
+    WHERE ia.cap_rate >= ? AND ia.monthly_cash_flow >= ?
+    ORDER BY ia.investment_score DESC, ia.cap_rate DESC
+    LIMIT ?
+'''
+
+
+def _project(columns: Optional[List[str]], table_columns: Tuple[str, ...],
+             include_raw: bool, required: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+    """
+    Resolve the columns a read should select.
+    
+    Args:
+        columns: Requested column names, or None for all of ``table_columns``
+        table_columns: Readable columns of the table (raw_data excluded)
+        include_raw: Whether to add raw_data
+        required: Columns the query itself needs (e.g. for a pagination cursor)
+        
+    Returns:
+        Tuple of column names to select
+        
+    Raises:
+        ValueError: If a requested column does not exist in the table
+    """
+    if columns is None:
+        selected = table_columns
+    else:
+        unknown = set(columns).difference(table_columns, ('raw_data',))
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+        selected = tuple(dict.fromkeys(columns))
+    selected += tuple(column for column in required if column not in selected)
+    if include_raw and 'raw_data' not in selected:
+        selected += ('raw_data',)
+    return selected
+
+
+def _select_columns(columns: Tuple[str, ...], alias: str = '') -> str:
+    """
+    Build a SELECT column list, optionally qualified with a table alias.
+    
+    raw_data is read from the sidecar joined as ``r`` (see _raw_join()).
+    """
+    prefix = f"{alias}." if alias else ''
+    return ', '.join('r.raw_data AS raw_data' if column == 'raw_data' else prefix + column
+                     for column in columns)
+
+
+def _raw_join(table: str, columns: Tuple[str, ...], alias: str) -> str:
+    """Build the join onto ``table``'s raw_data sidecar, if raw_data was selected."""
+    if 'raw_data' not in columns:
+        return ''
+    raw_table, key = _RAW_TABLES[table]
+    return f" LEFT JOIN {raw_table} r ON r.{key} = {alias}.{key}"
+
+
+def _decode_raw_data(record: Dict[str, Any]) -> None:
+    """Decode a record's raw_data JSON in place, leaving undecodable text as is."""
+    if record['raw_data']:
+        try:
+            record['raw_data'] = _unpack_raw(record['raw_data'])
+        except (json.JSONDecodeError, zlib.error):
+            pass
+
+
+def _decode_json_column(record: Dict[str, Any], column: str) -> None:
+    """Decode a plain JSON text column in place, leaving undecodable text as is."""
+    if record[column]:
+        try:
+            record[column] = json.loads(record[column])
+        except json.JSONDecodeError:
+            pass
+
+
+def _fetch_records(cursor: sqlite3.Cursor,
+                   json_column: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Fetch a cursor's remaining rows as dictionaries.
+    
+    Rows are read as plain tuples and zipped with column names taken once
+    from the cursor, instead of building a sqlite3.Row per row and copying
+    it into a dict. raw_data is decoded where it was selected, as is
+    ``json_column`` (a raw JSON text column such as raw_avm_data).
+    """
+    columns = [description[0] for description in cursor.description]
+    records = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    if 'raw_data' in columns:
+        for record in records:
+            _decode_raw_data(record)
+    if json_column in columns:
+        for record in records:
+            _decode_json_column(record, json_column)
+    return records
+
+
+# Rows pulled per fetchmany() call when streaming results
+_FETCH_BATCH_SIZE = 1000
+
+
+def _iter_records(cursor: sqlite3.Cursor,
+                  size: int = _FETCH_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """Like _fetch_records(), but yield rows while reading ``size`` at a time."""
+    columns = [description[0] for description in cursor.description]
+    decode_raw = 'raw_data' in columns
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        for row in rows:
+            record = dict(zip(columns, row))
+            if decode_raw:
+                _decode_raw_data(record)
+            yield record
+
+
+# Supported search criteria: (criteria field, operator) -> (column, SQL
+# comparison). The order here fixes the order of WHERE terms and bind values.
+_CRITERIA_FILTERS = {
+    ('price', 'min'): ('price', '>='),
+    ('price', 'max'): ('price', '<='),
+    ('bedrooms', 'min'): ('bedrooms', '>='),
+    ('bathrooms', 'min'): ('bathrooms', '>='),
+    ('square_feet', 'min'): ('square_feet', '>='),
+    ('square_feet', 'max'): ('square_feet', '<='),
+    ('cities', 'in'): ('city', 'IN'),
+    ('property_type', 'in'): ('property_type', 'IN'),
+    ('days_on_market', 'max'): ('days_on_market', '<='),
+}
+
+
+# Position of each filter in _CRITERIA_FILTERS, and the fields it covers
+_CRITERIA_ORDER = {key: position for position, key in enumerate(_CRITERIA_FILTERS)}
+_CRITERIA_FIELDS = frozenset(field for field, _ in _CRITERIA_FILTERS)
+
+
+def _criteria_shape(criteria: Dict[str, Any]) -> Tuple:
+    """
+    Reduce search criteria to a hashable shape, ignoring their values.
+    
+    Args:
+        criteria: Search criteria dictionary
+        
+    Returns:
+        Tuple with one (field, operator, list length or None) entry per
+        applied filter, in the order the criteria give them
+    """
+    return tuple(
+        (field, op, len(value) if op == 'in' else None)
+        for field, ops in criteria.items() if field in _CRITERIA_FIELDS
+        for op, value in ops.items() if (field, op) in _CRITERIA_FILTERS
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_criteria(criteria_key: Tuple) -> Tuple[str, Callable[[Dict[str, Any]], List[Any]]]:
+    """
+    Compile a criteria shape from _criteria_shape() into its WHERE terms
+    and a function pulling the bind values out of matching criteria.
+    
+    Terms follow the _CRITERIA_FILTERS order whatever order the criteria
+    use, so equal filter sets get the identical string back and the
+    statement cache reuses its prepared form.
+    """
+    terms = sorted(criteria_key, key=lambda term: _CRITERIA_ORDER[term[:2]])
+    
+    query_parts = []
+    for field, op, count in terms:
+        column, comparison = _CRITERIA_FILTERS[(field, op)]
+        if count is None:
+            query_parts.append(f"AND {column} {comparison} ?")
+        else:
+            placeholders = ','.join('?' * count)
+            query_parts.append(f"AND {column} {comparison} ({placeholders})")
+    
+    getters = tuple((field, op, count is not None) for field, op, count in terms)
+    
+    def extract_params(criteria: Dict[str, Any]) -> List[Any]:
+        params = []
+        for field, op, is_list in getters:
+            if is_list:
+                params.extend(criteria[field][op])
+            else:
+                params.append(criteria[field][op])
+        return params
+    
+    return ' ' + ' '.join(query_parts), extract_params
+
+
+# Rows bound per executemany() call when saving, to bound memory on large inputs
+_INSERT_BATCH_SIZE = 1000
+
+
+def _batched(rows: Iterable[Any], size: int = _INSERT_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Split an iterable of rows into lists of at most ``size`` rows."""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _json_loads(content: str) -> Any:
+    """Decode a stored JSON column, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Encode a record for a JSON TEXT column, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            # Non-string keys and similar edge cases keep the standard encoder's behavior
+            pass
+    return json.dumps(obj)
+
+
+# zlib level for raw records; their repetitive JSON keys compress several-fold
+_RAW_COMPRESSION_LEVEL = 6
+
+
+def _pack_raw(obj: Any) -> bytes:
+    """Encode a raw API record as zlib-compressed JSON for the sidecar tables."""
+    return zlib.compress(_json_dumps(obj).encode('utf-8'), _RAW_COMPRESSION_LEVEL)
+
+
+def _unpack_raw(value: Any) -> Any:
+    """Decode a stored raw record; rows written before compression hold JSON text."""
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return _json_loads(value)
+
+
+# Schema version recorded in PRAGMA user_version once _SCHEMA_DDL and the
+# migrations in _init_sqlite_database() have run; bump it whenever either
+# changes so existing databases pick the change up
+_SCHEMA_VERSION = 8
+
+# Tables whose row count is kept in row_counts by triggers, so
+# get_database_stats() does not scan them. For tables saved with INSERT
+# OR REPLACE the value is the condition matching the row a new one would
+# replace; those inserts are not counted, since the replaced row's
+# delete fires no trigger.
+_COUNTED_TABLES = {
+    'properties': 'property_id = NEW.property_id',
+    'analysis_results': None,
+    'notifications_log': None,
+    'avm_valuations': None,
+    'market_statistics': ('zip_code = NEW.zip_code AND property_type = NEW.property_type '
+                          'AND bedrooms = NEW.bedrooms AND analysis_month = NEW.analysis_month'),
+    'property_comparables': None,
+    'investment_analysis': None,
+    'price_history': None,
+}
+
+
+def _row_count_triggers(table: str, replaces: Optional[str]) -> str:
+    """Build the triggers keeping a table's row_counts entry current."""
+    when = f"WHEN NOT EXISTS (SELECT 1 FROM {table} WHERE {replaces})\n" if replaces else ''
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_count_insert\n"
+        f"BEFORE INSERT ON {table}\n{when}BEGIN\n"
+        f"    UPDATE row_counts SET n = n + 1 WHERE table_name = '{table}';\n"
+        f"END;\n"
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_count_delete\n"
+        f"AFTER DELETE ON {table} BEGIN\n"
+        f"    UPDATE row_counts SET n = n - 1 WHERE table_name = '{table}';\n"
+        f"END;\n"
+    )
+
+
+# Full schema, run as one script at startup. Every statement is idempotent,
+# so it is safe to run against an existing database.
+_SCHEMA_DDL = '''
+-- Create properties table
+CREATE TABLE IF NOT EXISTS properties (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_id TEXT UNIQUE,
+    source TEXT NOT NULL,
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code TEXT,
+    price REAL,
+    bedrooms INTEGER,
+    bathrooms REAL,
+    square_feet INTEGER,
+    lot_size REAL,
+    year_built INTEGER,
+    property_type TEXT,
+    listing_date TEXT,
+    days_on_market INTEGER,
+    url TEXT,
+    latitude REAL,
+    longitude REAL,
+    description TEXT,
+    raw_data TEXT, -- unused; see properties_raw / listings_raw
+    fetched_at TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create listings table (new approach for storing market listings)
+CREATE TABLE IF NOT EXISTS listings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    listing_id TEXT UNIQUE,
+    property_id TEXT,
+    source TEXT NOT NULL,
+    listing_type TEXT NOT NULL, -- 'sale' or 'rental'
+    address TEXT,
+    city TEXT,
+    state TEXT,
+    zip_code TEXT,
+    price REAL,
+    bedrooms INTEGER,
+    bathrooms REAL,
+    square_feet INTEGER,
+    lot_size REAL,
+    year_built INTEGER,
+    property_type TEXT,
+    listing_date TEXT,
+    days_on_market INTEGER,
+    status TEXT, -- 'active', 'pending', 'sold', etc.
+    url TEXT,
+    latitude REAL,
+    longitude REAL,
+    description TEXT,
+    raw_data TEXT, -- unused; see properties_raw / listings_raw
+    fetched_at TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    mls_number TEXT -- promoted from the raw record; see the version 2 migration
+);
+
+-- Raw API records, split out of the main tables so their
+-- pages hold only the structured columns. The triggers drop
+-- a record with its row; INSERT OR REPLACE does not fire them.
+CREATE TABLE IF NOT EXISTS properties_raw (
+    property_id TEXT PRIMARY KEY,
+    raw_data BLOB -- zlib-compressed JSON
+);
+
+CREATE TABLE IF NOT EXISTS listings_raw (
+    listing_id TEXT PRIMARY KEY,
+    raw_data BLOB -- zlib-compressed JSON
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_properties_raw_delete
+AFTER DELETE ON properties BEGIN
+    DELETE FROM properties_raw WHERE property_id = OLD.property_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_listings_raw_delete
+AFTER DELETE ON listings BEGIN
+    DELETE FROM listings_raw WHERE listing_id = OLD.listing_id;
+END;
+
+-- Full-text index of property addresses and cities for
+-- search_properties_by_address(), reading its text from properties.
+-- An external-content index must be told the old text of every row it
+-- drops, so the replace trigger does that for the row an INSERT OR
+-- REPLACE is about to remove (its delete fires no trigger).
+CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5(
+    address, city, content='properties', content_rowid='id', tokenize='unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_properties_fts_replace
+BEFORE INSERT ON properties BEGIN
+    INSERT INTO properties_fts (properties_fts, rowid, address, city)
+    SELECT 'delete', id, address, city FROM properties WHERE property_id = NEW.property_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_properties_fts_insert
+AFTER INSERT ON properties BEGIN
+    INSERT INTO properties_fts (rowid, address, city) VALUES (NEW.id, NEW.address, NEW.city);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_properties_fts_delete
+AFTER DELETE ON properties BEGIN
+    INSERT INTO properties_fts (properties_fts, rowid, address, city)
+    VALUES ('delete', OLD.id, OLD.address, OLD.city);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_properties_fts_update
+AFTER UPDATE OF address, city ON properties BEGIN
+    INSERT INTO properties_fts (properties_fts, rowid, address, city)
+    VALUES ('delete', OLD.id, OLD.address, OLD.city);
+    INSERT INTO properties_fts (rowid, address, city) VALUES (NEW.id, NEW.address, NEW.city);
+END;
+
+-- Per-city rollup of properties for get_city_statistics(); emptied by
+-- the triggers below on every write to properties that can change it,
+-- whichever code path makes it, and rebuilt on the next read
+CREATE TABLE IF NOT EXISTS city_stats_mv (
+    city TEXT PRIMARY KEY,
+    property_count INTEGER NOT NULL,
+    n_price INTEGER NOT NULL,
+    sum_price REAL NOT NULL,
+    min_price REAL,
+    max_price REAL,
+    n_sqft INTEGER NOT NULL,
+    sum_sqft REAL NOT NULL,
+    n_dom INTEGER NOT NULL,
+    sum_dom REAL NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_city_stats_insert
+AFTER INSERT ON properties BEGIN
+    DELETE FROM city_stats_mv;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_city_stats_update
+AFTER UPDATE OF city, price, square_feet, days_on_market ON properties BEGIN
+    DELETE FROM city_stats_mv;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_city_stats_delete
+AFTER DELETE ON properties BEGIN
+    DELETE FROM city_stats_mv;
+END;
+
+-- Row counts of the tables in _COUNTED_TABLES, kept by the triggers
+-- appended below and seeded by the version 5 migration
+CREATE TABLE IF NOT EXISTS row_counts (
+    table_name TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+);
+
+-- Create analysis_results table
+CREATE TABLE IF NOT EXISTS analysis_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    analysis_type TEXT NOT NULL,
+    results TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create AVM (Automated Valuation Model) data table
+CREATE TABLE IF NOT EXISTS avm_valuations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_id TEXT NOT NULL,
+    address TEXT NOT NULL,
+    estimated_value REAL,
+    estimated_rent REAL,
+    confidence_score REAL,
+    value_range_low REAL,
+    value_range_high REAL,
+    rent_range_low REAL,
+    rent_range_high REAL,
+    comparables_count INTEGER,
+    cap_rate REAL,
+    cash_flow REAL,
+    roi_percentage REAL,
+    raw_avm_data TEXT,
+    fetched_at DATETIME NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (property_id) REFERENCES properties(property_id)
+);
+
+-- Create market statistics table
+CREATE TABLE IF NOT EXISTS market_statistics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    zip_code TEXT NOT NULL,
+    city TEXT,
+    state TEXT,
+    property_type TEXT,
+    bedrooms INTEGER,
+    avg_sale_price REAL,
+    median_sale_price REAL,
+    avg_rent_price REAL,
+    median_rent_price REAL,
+    avg_price_per_sqft REAL,
+    avg_rent_per_sqft REAL,
+    inventory_count INTEGER,
+    avg_days_on_market INTEGER,
+    rent_yield_percentage REAL,
+    price_trend_3m TEXT,
+    price_trend_6m TEXT,
+    price_trend_12m TEXT,
+    raw_market_data TEXT,
+    analysis_month TEXT NOT NULL,
+    fetched_at DATETIME NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(zip_code, property_type, bedrooms, analysis_month)
+);
+
+-- Create property comparables table
+CREATE TABLE IF NOT EXISTS property_comparables (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_property_id TEXT NOT NULL,
+    comparable_property_id TEXT,
+    comparable_address TEXT,
+    sale_price REAL,
+    sale_date TEXT,
+    distance_miles REAL,
+    bedrooms INTEGER,
+    bathrooms REAL,
+    square_feet INTEGER,
+    price_per_sqft REAL,
+    days_on_market INTEGER,
+    similarity_score REAL,
+    raw_comparable_data TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (source_property_id) REFERENCES properties(property_id)
+);
+
+-- Create investment analysis table
+CREATE TABLE IF NOT EXISTS investment_analysis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_id TEXT NOT NULL,
+    purchase_price REAL NOT NULL,
+    estimated_rent REAL,
+    estimated_expenses REAL,
+    cap_rate REAL,
+    cash_on_cash_return REAL,
+    gross_yield REAL,
+    net_yield REAL,
+    monthly_cash_flow REAL,
+    annual_cash_flow REAL,
+    break_even_ratio REAL,
+    investment_score REAL,
+    risk_level TEXT,
+    analysis_notes TEXT,
+    analysis_date DATE NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (property_id) REFERENCES properties(property_id)
+);
+
+-- Create price history tracking table
+CREATE TABLE IF NOT EXISTS price_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_id TEXT NOT NULL,
+    price REAL NOT NULL,
+    price_type TEXT NOT NULL, -- 'list', 'sale', 'estimated'
+    date_recorded DATE NOT NULL,
+    source TEXT NOT NULL,
+    notes TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (property_id) REFERENCES properties(property_id)
+);
+
+-- Create notifications_log table
+CREATE TABLE IF NOT EXISTS notifications_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    notification_type TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    subject TEXT,
+    status TEXT NOT NULL,
+    property_count INTEGER,
+    sent_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for better performance (property indexes are appended
+-- from _PROPERTY_INDEXES below)
+
+-- Superseded by the composite indexes that lead with the same column
+DROP INDEX IF EXISTS idx_properties_city;
+DROP INDEX IF EXISTS idx_properties_fetched_at;
+DROP INDEX IF EXISTS idx_properties_price;
+DROP INDEX IF EXISTS idx_avm_property_id;
+DROP INDEX IF EXISTS idx_market_zip_code;
+DROP INDEX IF EXISTS idx_comparables_source_property;
+
+CREATE INDEX IF NOT EXISTS idx_listings_city
+ON listings(city);
+
+CREATE INDEX IF NOT EXISTS idx_listings_price
+ON listings(price);
+
+CREATE INDEX IF NOT EXISTS idx_listings_type
+ON listings(listing_type);
+
+CREATE INDEX IF NOT EXISTS idx_listings_status
+ON listings(status);
+
+-- AVM valuations indexes; (property_id, fetched_at) finds the latest
+-- valuation of a property without a sort
+CREATE INDEX IF NOT EXISTS idx_avm_prop_fetched
+ON avm_valuations(property_id, fetched_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_avm_estimated_value
+ON avm_valuations(estimated_value);
+
+CREATE INDEX IF NOT EXISTS idx_avm_fetched_at
+ON avm_valuations(fetched_at);
+
+-- Market statistics indexes; (zip_code, analysis_month) returns a ZIP
+-- code's months newest first without a sort. Lookups that also give
+-- the property type and bedrooms use the UNIQUE constraint's index.
+CREATE INDEX IF NOT EXISTS idx_market_zip_month
+ON market_statistics(zip_code, analysis_month DESC);
+
+CREATE INDEX IF NOT EXISTS idx_market_analysis_month
+ON market_statistics(analysis_month);
+
+CREATE INDEX IF NOT EXISTS idx_market_property_type
+ON market_statistics(property_type);
+
+-- Comparables indexes; (source_property_id, similarity_score) reads a
+-- property's best matches in order and stops at the LIMIT
+CREATE INDEX IF NOT EXISTS idx_comparables_src_sim
+ON property_comparables(source_property_id, similarity_score DESC);
+
+CREATE INDEX IF NOT EXISTS idx_comparables_similarity
+ON property_comparables(similarity_score);
+
+-- Investment analysis indexes
+CREATE INDEX IF NOT EXISTS idx_investment_property_id
+ON investment_analysis(property_id);
+
+CREATE INDEX IF NOT EXISTS idx_investment_score
+ON investment_analysis(investment_score);
+
+CREATE INDEX IF NOT EXISTS idx_investment_cap_rate
+ON investment_analysis(cap_rate);
+
+-- Price history indexes
+CREATE INDEX IF NOT EXISTS idx_price_history_property_id
+ON price_history(property_id);
+
+CREATE INDEX IF NOT EXISTS idx_price_history_date
+ON price_history(date_recorded);
+
+CREATE INDEX IF NOT EXISTS idx_price_history_type
+ON price_history(price_type);
+''' + ''.join(
+    f"CREATE INDEX IF NOT EXISTS {name} ON {target};\n"
+    for name, target in _PROPERTY_INDEXES.items()
+) + ''.join(
+    _row_count_triggers(table, replaces) for table, replaces in _COUNTED_TABLES.items()
+)
+
+
 @dataclass
 class PaginationParams:
-    """Parameters for database pagination."""
+    """
+    Parameters for database pagination.
+    
+    Pages are addressed either by ``offset`` or, where supported, by a keyset
+    ``cursor`` taken from a previous result's ``next_cursor``. Cursor pages
+    cost the same at any depth, while an offset is scanned and discarded.
+    Setting ``include_count`` to False skips the COUNT(*) query where
+    supported; the result's ``total_count`` is then None.
+    """
     limit: int = 50
     offset: int = 0
+    cursor: Optional[Tuple[Any, ...]] = None
+    include_count: bool = True
     
     def __post_init__(self):
         """Validate pagination parameters."""
@@ -29,25 +939,48 @@ class PaginationParams:
             raise ValueError("Limit must be between 1 and 500")
         if self.offset < 0:
             raise ValueError("Offset must be non-negative")
+        if self.cursor is not None and self.offset:
+            raise ValueError("Offset and cursor cannot be combined")
 
 
 @dataclass
 class PaginatedResult:
     """Result container for paginated database queries."""
     data: List[Dict[str, Any]]
-    total_count: int
+    total_count: Optional[int]
     limit: int
     offset: int
     has_more: bool
     next_offset: Optional[int] = None
+    cursor: Optional[Tuple[Any, ...]] = None
+    next_cursor: Optional[Tuple[Any, ...]] = None
     
     def __post_init__(self):
         """Calculate pagination metadata."""
-        self.has_more = (self.offset + len(self.data)) < self.total_count
+        # Keyset and uncounted pages set has_more from the query itself,
+        # since their position within total_count is unknown
+        if self.cursor is None and self.total_count is not None:
+            self.has_more = (self.offset + len(self.data)) < self.total_count
         if self.has_more:
-            self.next_offset = self.offset + self.limit
+            self.next_offset = None if self.cursor is not None else self.offset + self.limit
         else:
             self.next_offset = None
+            self.next_cursor = None
+
+
+class _ThreadConnection:
+    """
+    One thread's connection, held in the manager's thread-local storage.
+    
+    The holder is released when its thread ends, and a finalizer then
+    closes the connection, so short-lived threads (one per web request)
+    don't each leave a connection and its file handles open.
+    """
+    __slots__ = ('conn', '__weakref__')
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
 
 
 class DatabaseManager:
@@ -66,333 +999,143 @@ class DatabaseManager:
         if self.db_type == 'sqlite':
             self.db_path = Path(db_config.get('sqlite_path', 'data/real_estate.db'))
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # One long-lived connection per thread, opened on first use, so
+            # threads read concurrently under WAL instead of queueing on a
+            # shared connection. Live threads' connections are tracked
+            # weakly so close() can close them without keeping those of
+            # finished threads open.
+            self._local = threading.local()
+            self._connections: 'weakref.WeakSet[_ThreadConnection]' = weakref.WeakSet()
+            self._conn_lock = threading.Lock()
+            
             self._init_sqlite_database()
         else:
             raise ValueError(f"Unsupported database type: {self.db_type}")
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open a connection to the SQLite database with the module's PRAGMA tuning applied.
+        
+        PRAGMAs are per-connection, so every connection must be opened here.
+        
+        Returns:
+            Configured SQLite connection
+        """
+        # Each connection runs every query in the module, so keep more than
+        # the default 128 prepared statements cached. Connections stay on
+        # their own thread; close() may close them from another one.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the calling thread's connection for one unit of work.
+        
+        Reusing the connection avoids reopening the database and re-parsing
+        the schema on every call, and keeps its statement and page caches
+        warm. The block runs as a transaction: committed on success, rolled
+        back on error. The row factory is reset to plain tuples on entry.
+        
+        Yields:
+            The thread's SQLite connection
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            holder = _ThreadConnection(self._open_connection())
+            self._local.holder = holder
+            with self._conn_lock:
+                self._connections.add(holder)
+        conn = holder.conn
+        conn.row_factory = None
+        with conn:
+            yield conn
+    
     def _init_sqlite_database(self) -> None:
         """Initialize SQLite database and create tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Create properties table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS properties (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        property_id TEXT UNIQUE,
-                        source TEXT NOT NULL,
-                        address TEXT,
-                        city TEXT,
-                        state TEXT,
-                        zip_code TEXT,
-                        price REAL,
-                        bedrooms INTEGER,
-                        bathrooms REAL,
-                        square_feet INTEGER,
-                        lot_size REAL,
-                        year_built INTEGER,
-                        property_type TEXT,
-                        listing_date TEXT,
-                        days_on_market INTEGER,
-                        url TEXT,
-                        latitude REAL,
-                        longitude REAL,
-                        description TEXT,
-                        raw_data TEXT,
-                        fetched_at TEXT NOT NULL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create listings table (new approach for storing market listings)
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS listings (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        listing_id TEXT UNIQUE,
-                        property_id TEXT,
-                        source TEXT NOT NULL,
-                        listing_type TEXT NOT NULL, -- 'sale' or 'rental'
-                        address TEXT,
-                        city TEXT,
-                        state TEXT,
-                        zip_code TEXT,
-                        price REAL,
-                        bedrooms INTEGER,
-                        bathrooms REAL,
-                        square_feet INTEGER,
-                        lot_size REAL,
-                        year_built INTEGER,
-                        property_type TEXT,
-                        listing_date TEXT,
-                        days_on_market INTEGER,
-                        status TEXT, -- 'active', 'pending', 'sold', etc.
-                        url TEXT,
-                        latitude REAL,
-                        longitude REAL,
-                        description TEXT,
-                        raw_data TEXT,
-                        fetched_at TEXT NOT NULL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create analysis_results table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS analysis_results (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        analysis_type TEXT NOT NULL,
-                        results TEXT NOT NULL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create AVM (Automated Valuation Model) data table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS avm_valuations (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        property_id TEXT NOT NULL,
-                        address TEXT NOT NULL,
-                        estimated_value REAL,
-                        estimated_rent REAL,
-                        confidence_score REAL,
-                        value_range_low REAL,
-                        value_range_high REAL,
-                        rent_range_low REAL,
-                        rent_range_high REAL,
-                        comparables_count INTEGER,
-                        cap_rate REAL,
-                        cash_flow REAL,
-                        roi_percentage REAL,
-                        raw_avm_data TEXT,
-                        fetched_at DATETIME NOT NULL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (property_id) REFERENCES properties(property_id)
-                    )
-                ''')
-                
-                # Create market statistics table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS market_statistics (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        zip_code TEXT NOT NULL,
-                        city TEXT,
-                        state TEXT,
-                        property_type TEXT,
-                        bedrooms INTEGER,
-                        avg_sale_price REAL,
-                        median_sale_price REAL,
-                        avg_rent_price REAL,
-                        median_rent_price REAL,
-                        avg_price_per_sqft REAL,
-                        avg_rent_per_sqft REAL,
-                        inventory_count INTEGER,
-                        avg_days_on_market INTEGER,
-                        rent_yield_percentage REAL,
-                        price_trend_3m TEXT,
-                        price_trend_6m TEXT,
-                        price_trend_12m TEXT,
-                        raw_market_data TEXT,
-                        analysis_month TEXT NOT NULL,
-                        fetched_at DATETIME NOT NULL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(zip_code, property_type, bedrooms, analysis_month)
-                    )
-                ''')
-                
-                # Create property comparables table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS property_comparables (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        source_property_id TEXT NOT NULL,
-                        comparable_property_id TEXT,
-                        comparable_address TEXT,
-                        sale_price REAL,
-                        sale_date TEXT,
-                        distance_miles REAL,
-                        bedrooms INTEGER,
-                        bathrooms REAL,
-                        square_feet INTEGER,
-                        price_per_sqft REAL,
-                        days_on_market INTEGER,
-                        similarity_score REAL,
-                        raw_comparable_data TEXT,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (source_property_id) REFERENCES properties(property_id)
-                    )
-                ''')
-                
-                # Create investment analysis table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS investment_analysis (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        property_id TEXT NOT NULL,
-                        purchase_price REAL NOT NULL,
-                        estimated_rent REAL,
-                        estimated_expenses REAL,
-                        cap_rate REAL,
-                        cash_on_cash_return REAL,
-                        gross_yield REAL,
-                        net_yield REAL,
-                        monthly_cash_flow REAL,
-                        annual_cash_flow REAL,
-                        break_even_ratio REAL,
-                        investment_score REAL,
-                        risk_level TEXT,
-                        analysis_notes TEXT,
-                        analysis_date DATE NOT NULL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (property_id) REFERENCES properties(property_id)
-                    )
-                ''')
-                
-                # Create price history tracking table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS price_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        property_id TEXT NOT NULL,
-                        price REAL NOT NULL,
-                        price_type TEXT NOT NULL, -- 'list', 'sale', 'estimated'
-                        date_recorded DATE NOT NULL,
-                        source TEXT NOT NULL,
-                        notes TEXT,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (property_id) REFERENCES properties(property_id)
-                    )
-                ''')
-                
-                # Create notifications_log table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS notifications_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        notification_type TEXT NOT NULL,
-                        recipient TEXT NOT NULL,
-                        subject TEXT,
-                        status TEXT NOT NULL,
-                        property_count INTEGER,
-                        sent_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Create indexes for better performance
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_properties_city 
-                    ON properties(city)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_properties_price 
-                    ON properties(price)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_listings_city 
-                    ON listings(city)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_listings_price 
-                    ON listings(price)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_listings_type 
-                    ON listings(listing_type)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_listings_status 
-                    ON listings(status)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_properties_listing_date 
-                    ON properties(listing_date)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_properties_fetched_at 
-                    ON properties(fetched_at)
-                ''')
-                
-                # AVM valuations indexes
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_avm_property_id 
-                    ON avm_valuations(property_id)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_avm_estimated_value 
-                    ON avm_valuations(estimated_value)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_avm_fetched_at 
-                    ON avm_valuations(fetched_at)
-                ''')
-                
-                # Market statistics indexes
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_market_zip_code 
-                    ON market_statistics(zip_code)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_market_analysis_month 
-                    ON market_statistics(analysis_month)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_market_property_type 
-                    ON market_statistics(property_type)
-                ''')
-                
-                # Comparables indexes
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_comparables_source_property 
-                    ON property_comparables(source_property_id)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_comparables_similarity 
-                    ON property_comparables(similarity_score)
-                ''')
-                
-                # Investment analysis indexes
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_investment_property_id 
-                    ON investment_analysis(property_id)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_investment_score 
-                    ON investment_analysis(investment_score)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_investment_cap_rate 
-                    ON investment_analysis(cap_rate)
-                ''')
-                
-                # Price history indexes
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_price_history_property_id 
-                    ON price_history(property_id)
-                ''')
+            with self._connect() as conn:
+                # A database already at the current version has the full
+                # schema; skip the DDL so constructing a manager stays cheap
+                if conn.execute('PRAGMA user_version').fetchone()[0] >= _SCHEMA_VERSION:
+                    logger.debug("Database schema is up to date")
+                    return
+                
+                # WAL persists in the database file; it must be enabled
+                # outside a transaction, before any schema changes
+                conn.execute('PRAGMA journal_mode = WAL')
+                
+                # The schema runs as one script, parsed and executed by
+                # SQLite without a round trip per statement. The write lock
+                # taken up front is held through the migrations below, so
+                # processes starting together apply them only once.
+                conn.executescript(f"BEGIN IMMEDIATE;\n{_SCHEMA_DDL}")
                 
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_price_history_date 
-                    ON price_history(date_recorded)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_price_history_type 
-                    ON price_history(price_type)
-                ''')
+                cursor = conn.cursor()
                 
+                # Databases created before the split keep raw_data inline;
+                # move it to the sidecars once and clear the old column
+                version = cursor.execute('PRAGMA user_version').fetchone()[0]
+                if version < 1:
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO properties_raw (property_id, raw_data)
+                        SELECT property_id, raw_data FROM properties
+                        WHERE raw_data IS NOT NULL AND property_id IS NOT NULL
+                    ''')
+                    cursor.execute(
+                        'UPDATE properties SET raw_data = NULL WHERE raw_data IS NOT NULL')
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO listings_raw (listing_id, raw_data)
+                        SELECT listing_id, raw_data FROM listings
+                        WHERE raw_data IS NOT NULL AND listing_id IS NOT NULL
+                    ''')
+                    cursor.execute('UPDATE listings SET raw_data = NULL WHERE raw_data IS NOT NULL')
+                
+                # Fields that get queried are promoted out of the compressed
+                # raw record into indexed columns, filled in at write time.
+                # Listings saved earlier are backfilled with json1 from raw
+                # records still stored as JSON text.
+                if version < 2:
+                    listing_columns = {
+                        row[1] for row in cursor.execute('PRAGMA table_info(listings)')}
+                    if 'mls_number' not in listing_columns:
+                        cursor.execute('ALTER TABLE listings ADD COLUMN mls_number TEXT')
+                    cursor.execute('''
+                        UPDATE listings SET mls_number = (
+                            SELECT COALESCE(json_extract(r.raw_data, '$.mls_number'),
+                                            json_extract(r.raw_data, '$.mlsNumber'))
+                            FROM listings_raw r
+                            WHERE r.listing_id = listings.listing_id
+                              AND typeof(r.raw_data) = 'text' AND json_valid(r.raw_data)
+                        )
+                        WHERE mls_number IS NULL
+                    ''')
+                    cursor.execute('CREATE INDEX IF NOT EXISTS idx_listings_mls_number '
+                                   'ON listings(mls_number)')
+                
+                # Seed the counters with one scan per table; the triggers
+                # created above keep them current from here on
+                if version < 5:
+                    for table in _COUNTED_TABLES:
+                        cursor.execute(f'''
+                            INSERT OR REPLACE INTO row_counts (table_name, n)
+                            SELECT '{table}', COUNT(*) FROM {table}
+                        ''')
+                
+                # Index the addresses of properties saved before the
+                # full-text index existed
+                if version < 7:
+                    cursor.execute("INSERT INTO properties_fts (properties_fts) VALUES ('rebuild')")
+                
+                # Writes made before the rollup triggers existed may have
+                # left it stale; the next read rebuilds it
+                if version < 8:
+                    cursor.execute('DELETE FROM city_stats_mv')
+                
+                cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
                 conn.commit()
                 logger.info("Database initialized successfully")
                 
@@ -414,34 +1157,104 @@ class DatabaseManager:
             return 0
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                saved_count = 0
                 
-                for prop in properties:
-                    # Prepare property data
-                    property_data = self._prepare_property_data(prop)
-                    
-                    # Try to insert or update
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO properties 
-                        (property_id, source, address, city, state, zip_code, price, 
-                         bedrooms, bathrooms, square_feet, lot_size, year_built, 
-                         property_type, listing_date, days_on_market, url, 
-                         latitude, longitude, description, raw_data, fetched_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', property_data)
-                    
-                    saved_count += 1
+                # One timestamp for the whole batch
+                now = datetime.now().isoformat()
+                
+                # Take the write lock up front so the whole batch is one
+                # transaction that can't fail midway on a lock upgrade
+                conn.execute('BEGIN IMMEDIATE')
+                
+                saved_count = self._insert_properties(cursor, properties, now)
+                
+                conn.commit()
+                logger.info(f"Saved {saved_count} properties to database")
+                return saved_count
+                
+        except Exception as e:
+            logger.error(f"Error saving properties: {str(e)}")
+            return 0
+    
+    def bulk_save_properties(self, properties: List[Dict[str, Any]],
+                             rebuild_indexes: bool = True) -> int:
+        """
+        Save a large batch of properties.
+        
+        With rebuild_indexes, the secondary property indexes are dropped
+        before the insert and rebuilt after it, all in one transaction, so
+        each index is built once from sorted data instead of being updated
+        row by row. Rebuilding scans the whole table, so this only pays off
+        when the batch is large relative to the table (e.g. initial or
+        full reloads); use save_properties() for routine saves.
+        
+        Args:
+            properties: List of property dictionaries
+            rebuild_indexes: Whether to drop and rebuild secondary indexes
+            
+        Returns:
+            Number of properties saved
+        """
+        if not properties:
+            return 0
+        
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                now = datetime.now().isoformat()
+                
+                conn.execute('BEGIN IMMEDIATE')
+                
+                if rebuild_indexes:
+                    for name in _PROPERTY_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+                
+                saved_count = self._insert_properties(cursor, properties, now)
+                
+                if rebuild_indexes:
+                    self._create_property_indexes(cursor)
                 
                 conn.commit()
-                logger.info(f"Saved {saved_count} properties to database")
+                logger.info(f"Bulk saved {saved_count} properties to database")
                 return saved_count
                 
         except Exception as e:
-            logger.error(f"Error saving properties: {str(e)}")
+            logger.error(f"Error bulk saving properties: {str(e)}")
             return 0
     
+    def _insert_properties(self, cursor: sqlite3.Cursor, properties: List[Dict[str, Any]],
+                           now: str) -> int:
+        """
+        Insert properties and their raw records within the caller's transaction.
+        
+        Args:
+            cursor: Cursor on the open connection
+            properties: List of property dictionaries
+            now: ISO timestamp shared by the batch
+            
+        Returns:
+            Number of properties inserted
+        """
+        saved_count = 0
+        
+        # Prepared rows are bound in chunks through one statement;
+        # each row's raw record goes to the sidecar table
+        for batch in _batched(properties):
+            cursor.executemany(_INSERT_PROPERTY_SQL,
+                               [self._prepare_property_data(prop, now) for prop in batch])
+            cursor.executemany(_INSERT_PROPERTY_RAW_SQL,
+                               [(prop.get('property_id', ''), _pack_raw(prop)) for prop in batch])
+            saved_count += len(batch)
+        
+        return saved_count
+    
+    @staticmethod
+    def _create_property_indexes(cursor: sqlite3.Cursor) -> None:
+        """Create any missing secondary indexes on the properties table."""
+        for name, target in _PROPERTY_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    
     def save_listings(self, listings: List[Dict[str, Any]]) -> int:
         """
         Save listings to the database.
@@ -456,25 +1269,27 @@ class DatabaseManager:
             return 0
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 saved_count = 0
                 
-                for listing in listings:
-                    # Prepare listing data
-                    listing_data = self._prepare_listing_data(listing)
-                    
-                    # Try to insert or update
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO listings 
-                        (listing_id, property_id, source, listing_type, address, city, state, zip_code, price, 
-                         bedrooms, bathrooms, square_feet, lot_size, year_built, 
-                         property_type, listing_date, days_on_market, status, url, 
-                         latitude, longitude, description, raw_data, fetched_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', listing_data)
-                    
-                    saved_count += 1
+                # One timestamp for the whole batch
+                now = datetime.now().isoformat()
+                
+                # Take the write lock up front so the whole batch is one
+                # transaction that can't fail midway on a lock upgrade
+                conn.execute('BEGIN IMMEDIATE')
+                
+                # Prepared rows are bound in chunks through one statement;
+                # each row's raw record goes to the sidecar table
+                for batch in _batched(listings):
+                    cursor.executemany(_INSERT_LISTING_SQL,
+                                       [self._prepare_listing_data(listing, now)
+                                        for listing in batch])
+                    cursor.executemany(_INSERT_LISTING_RAW_SQL,
+                                       [(listing.get('listing_id', listing.get('property_id', '')),
+                                         _pack_raw(listing)) for listing in batch])
+                    saved_count += len(batch)
                 
                 conn.commit()
                 logger.info(f"Saved {saved_count} listings to database")
@@ -484,256 +1299,390 @@ class DatabaseManager:
             logger.error(f"Error saving listings: {str(e)}")
             return 0
     
-    def get_all_properties(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_all_properties(self, limit: Optional[int] = None,
+                           include_raw: bool = False,
+                           columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all properties from the database.
         
         Args:
             limit: Optional limit on number of properties to return
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
             
         Returns:
             List of property dictionaries
         """
+        # LIMIT -1 is unbounded, so one statement serves every limit
+        return self._fetch_query(self._properties_query(include_raw, columns),
+                                 (limit or -1,), 'properties')
+    
+    def get_all_listings(self, limit: Optional[int] = None,
+                         include_raw: bool = False,
+                         columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get all listings from the database.
+        
+        Args:
+            limit: Optional limit on number of listings to return
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
+            
+        Returns:
+            List of listing dictionaries
+        """
+        return self._fetch_query(self._listings_query(include_raw, columns),
+                                 (limit or -1,), 'listings')
+    
+    def iter_properties(self, limit: Optional[int] = None,
+                        include_raw: bool = False,
+                        columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream properties from the database, newest first.
+        
+        Rows are fetched in batches as the iterator is consumed, so memory
+        stays flat however large the table is. The read runs on a
+        connection of its own, held until the iterator is exhausted or
+        closed, so the caller can use the database while consuming it.
+        
+        Args:
+            limit: Optional limit on number of properties to return
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
+            
+        Returns:
+            Iterator of property dictionaries
+        """
+        return self._iter_query(self._properties_query(include_raw, columns),
+                                (limit or -1,), 'properties')
+    
+    def iter_listings(self, limit: Optional[int] = None,
+                      include_raw: bool = False,
+                      columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream listings from the database, newest first.
+        
+        See iter_properties() for how rows are fetched.
+        
+        Args:
+            limit: Optional limit on number of listings to return
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
+            
+        Returns:
+            Iterator of listing dictionaries
+        """
+        return self._iter_query(self._listings_query(include_raw, columns),
+                                (limit or -1,), 'listings')
+    
+    @staticmethod
+    def _properties_query(include_raw: bool, columns: Optional[List[str]]) -> str:
+        """Build the newest-first read shared by get_all_properties() and iter_properties()."""
+        selected = _project(columns, _PROPERTY_COLUMNS, include_raw)
+        return (f"SELECT {_select_columns(selected, 'p')} FROM properties p"
+                f"{_raw_join('properties', selected, 'p')} ORDER BY p.created_at DESC LIMIT ?")
+    
+    @staticmethod
+    def _listings_query(include_raw: bool, columns: Optional[List[str]]) -> str:
+        """Build the newest-first read shared by get_all_listings() and iter_listings()."""
+        selected = _project(columns, _LISTING_COLUMNS, include_raw)
+        return (f"SELECT {_select_columns(selected, 'l')} FROM listings l"
+                f"{_raw_join('listings', selected, 'l')} ORDER BY l.created_at DESC LIMIT ?")
+    
+    def _fetch_query(self, query: str, params: Tuple, label: str) -> List[Dict[str, Any]]:
+        """
+        Run a query on the thread's connection and return its rows as dictionaries.
+        
+        Args:
+            query: SQL query
+            params: Bind values for the query
+            label: What is being read, for the error log
+            
+        Returns:
+            List of row dictionaries; empty if the read fails
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
-                query = "SELECT * FROM properties ORDER BY created_at DESC"
-                if limit:
-                    query += f" LIMIT {limit}"
-                
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                
-                properties = []
-                for row in rows:
-                    prop = dict(row)
-                    # Parse raw_data if it exists
-                    if prop.get('raw_data'):
-                        try:
-                            prop['raw_data'] = json.loads(prop['raw_data'])
-                        except json.JSONDecodeError:
-                            pass
-                    properties.append(prop)
-                
-                return properties
+                cursor.execute(query, params)
+                return _fetch_records(cursor)
                 
         except Exception as e:
-            logger.error(f"Error getting properties: {str(e)}")
+            logger.error(f"Error getting {label}: {str(e)}")
             return []
     
-    def get_all_listings(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _iter_query(self, query: str, params: Tuple, label: str) -> Iterator[Dict[str, Any]]:
         """
-        Get all listings from the database.
+        Run a query and yield its rows as dictionaries, batch by batch.
+        
+        The read runs on a connection of its own, opened for the iteration
+        and closed when it ends, rather than on the thread's connection.
+        The caller may then use the database freely while consuming the
+        iterator (e.g. saving results as they stream) without its
+        transactions committing or rolling back around the open read.
         
         Args:
-            limit: Optional limit on number of listings to return
+            query: SQL query
+            params: Bind values for the query
+            label: What is being read, for the error log
             
         Returns:
-            List of listing dictionaries
+            Iterator of row dictionaries; ends early if the read fails
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with closing(self._open_connection()) as conn:
                 cursor = conn.cursor()
-                
-                query = "SELECT * FROM listings ORDER BY created_at DESC"
-                if limit:
-                    query += f" LIMIT {limit}"
-                
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                
-                listings = []
-                for row in rows:
-                    listing = dict(row)
-                    # Parse raw_data if it exists
-                    if listing.get('raw_data'):
-                        try:
-                            listing['raw_data'] = json.loads(listing['raw_data'])
-                        except json.JSONDecodeError:
-                            pass
-                    listings.append(listing)
-                
-                return listings
+                cursor.execute(query, params)
+                yield from _iter_records(cursor)
                 
         except Exception as e:
-            logger.error(f"Error getting listings: {str(e)}")
-            return []
+            logger.error(f"Error getting {label}: {str(e)}")
     
-    def get_recent_properties(self, days: int = 7) -> List[Dict[str, Any]]:
+    def get_recent_properties(self, days: int = 7, include_raw: bool = False,
+                              columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get properties fetched in the last N days.
         
         Args:
             days: Number of days to look back
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
             
         Returns:
             List of recent property dictionaries
         """
+        selected = _project(columns, _PROPERTY_COLUMNS, include_raw)
+        
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM properties 
-                    WHERE fetched_at > ? 
-                    ORDER BY fetched_at DESC
+                cursor.execute(f'''
+                    SELECT {_select_columns(selected, 'p')} FROM properties p
+                    {_raw_join('properties', selected, 'p')}
+                    WHERE p.fetched_at > ? 
+                    ORDER BY p.fetched_at DESC
                 ''', (cutoff_date,))
                 
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return _fetch_records(cursor)
                 
         except Exception as e:
             logger.error(f"Error getting recent properties: {str(e)}")
             return []
     
-    def get_properties_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def get_properties_by_criteria(self, criteria: Dict[str, Any], include_raw: bool = False,
+                                   columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get properties matching specific criteria.
         
         Args:
             criteria: Dictionary with search criteria
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
             
         Returns:
             List of matching property dictionaries
         """
+        selected = _project(columns, _PROPERTY_COLUMNS, include_raw)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Build query based on criteria
-                query = "SELECT * FROM properties WHERE 1=1"
-                params = []
-                
-                # Price range
-                if 'price' in criteria:
-                    price_criteria = criteria['price']
-                    if 'min' in price_criteria:
-                        query += " AND price >= ?"
-                        params.append(price_criteria['min'])
-                    if 'max' in price_criteria:
-                        query += " AND price <= ?"
-                        params.append(price_criteria['max'])
-                
-                # Bedrooms
-                if 'bedrooms' in criteria:
-                    bed_criteria = criteria['bedrooms']
-                    if 'min' in bed_criteria:
-                        query += " AND bedrooms >= ?"
-                        params.append(bed_criteria['min'])
-                
-                # Bathrooms
-                if 'bathrooms' in criteria:
-                    bath_criteria = criteria['bathrooms']
-                    if 'min' in bath_criteria:
-                        query += " AND bathrooms >= ?"
-                        params.append(bath_criteria['min'])
-                
-                # Square feet
-                if 'square_feet' in criteria:
-                    sqft_criteria = criteria['square_feet']
-                    if 'min' in sqft_criteria:
-                        query += " AND square_feet >= ?"
-                        params.append(sqft_criteria['min'])
-                    if 'max' in sqft_criteria:
-                        query += " AND square_feet <= ?"
-                        params.append(sqft_criteria['max'])
-                
-                # Cities
-                if 'cities' in criteria and 'in' in criteria['cities']:
-                    cities = criteria['cities']['in']
-                    placeholders = ','.join(['?' for _ in cities])
-                    query += f" AND city IN ({placeholders})"
-                    params.extend(cities)
-                
-                # Property type
-                if 'property_type' in criteria and 'in' in criteria['property_type']:
-                    types = criteria['property_type']['in']
-                    placeholders = ','.join(['?' for _ in types])
-                    query += f" AND property_type IN ({placeholders})"
-                    params.extend(types)
-                
-                # Days on market
-                if 'days_on_market' in criteria:
-                    dom_criteria = criteria['days_on_market']
-                    if 'max' in dom_criteria:
-                        query += " AND days_on_market <= ?"
-                        params.append(dom_criteria['max'])
-                
-                query += " ORDER BY created_at DESC"
+                query_parts, params = self._build_criteria_query(criteria)
+                query = (f"SELECT {_select_columns(selected, 'p')} FROM properties p"
+                         f"{_raw_join('properties', selected, 'p')} WHERE 1=1{query_parts} "
+                         "ORDER BY created_at DESC")
                 
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
-                
-                return [dict(row) for row in rows]
+                return _fetch_records(cursor)
                 
         except Exception as e:
             logger.error(f"Error getting properties by criteria: {str(e)}")
             return []
     
+    def get_property_raw(self, property_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the raw API record stored for a property.
+        
+        Args:
+            property_id: Property identifier
+            
+        Returns:
+            Decoded raw record, or None if none is stored
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT raw_data FROM properties_raw WHERE property_id = ?', (property_id,)
+                ).fetchone()
+                
+                if row is None or not row[0]:
+                    return None
+                return _unpack_raw(row[0])
+                
+        except Exception as e:
+            logger.error(f"Error getting raw data for property {property_id}: {str(e)}")
+            return None
+    
+    def get_listings_by_mls_number(self, mls_number: str, include_raw: bool = False,
+                                   columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get listings by MLS number.
+        
+        MLS numbers are only unique within one MLS, so more than one
+        listing can match.
+        
+        Args:
+            mls_number: MLS listing number
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
+            
+        Returns:
+            List of matching listing dictionaries, newest first
+        """
+        selected = _project(columns, _LISTING_COLUMNS, include_raw)
+        
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT {_select_columns(selected, 'l')} FROM listings l"
+                    f"{_raw_join('listings', selected, 'l')} "
+                    "WHERE l.mls_number = ? ORDER BY l.created_at DESC",
+                    (mls_number,)
+                )
+                return _fetch_records(cursor)
+                
+        except Exception as e:
+            logger.error(f"Error getting listings for MLS number {mls_number}: {str(e)}")
+            return []
+    
+    def search_properties_by_address(self, query: str, limit: int = 50,
+                                     include_raw: bool = False,
+                                     columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Search properties by words in their address or city.
+        
+        Uses the properties_fts full-text index, so a word anywhere in the
+        address is found without scanning the table. Every word of the
+        query must match; results are ranked best match first (BM25).
+        
+        Args:
+            query: Words to search for, e.g. "elm street austin"
+            limit: Maximum number of properties to return
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data)
+            
+        Returns:
+            List of matching property dictionaries
+        """
+        # Quote each word so punctuation in addresses ("St.", "#4") is
+        # matched as text rather than parsed as FTS5 query syntax
+        terms = ' '.join('"' + word.replace('"', '""') + '"' for word in query.split())
+        if not terms:
+            return []
+        
+        selected = _project(columns, _PROPERTY_COLUMNS, include_raw)
+        
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT {_select_columns(selected, 'p')} FROM properties_fts f "
+                    f"JOIN properties p ON p.id = f.rowid{_raw_join('properties', selected, 'p')} "
+                    "WHERE properties_fts MATCH ? ORDER BY f.rank LIMIT ?",
+                    (terms, limit)
+                )
+                return _fetch_records(cursor)
+                
+        except Exception as e:
+            logger.error(f"Error searching properties by address: {str(e)}")
+            return []
+    
     # Paginated query methods
     
     def get_properties_paginated(self, pagination: PaginationParams, 
-                                criteria: Optional[Dict[str, Any]] = None) -> PaginatedResult:
+                                criteria: Optional[Dict[str, Any]] = None,
+                                include_raw: bool = False,
+                                columns: Optional[List[str]] = None) -> PaginatedResult:
         """
         Get properties with pagination support.
         
+        Properties are ordered newest first by (created_at, id). Each result
+        carries a ``next_cursor``; passing it back as ``pagination.cursor``
+        seeks straight to the next page through the index instead of
+        skipping ``offset`` rows.
+        
         Args:
-            pagination: Pagination parameters (limit, offset)
+            pagination: Pagination parameters (limit, and offset or cursor)
             criteria: Optional search criteria
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data); id and
+                created_at are always included for the cursor
             
         Returns:
             PaginatedResult containing properties and pagination metadata
         """
+        selected = _project(columns, _PROPERTY_COLUMNS, include_raw, required=('id', 'created_at'))
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Build base query
-                base_query = "FROM properties WHERE 1=1"
+                where_clause = "WHERE 1=1"
                 params = []
                 
                 # Add criteria filters if provided
                 if criteria:
                     query_parts, filter_params = self._build_criteria_query(criteria)
-                    base_query += query_parts
+                    where_clause += query_parts
                     params.extend(filter_params)
-                
-                # Get total count
-                count_query = f"SELECT COUNT(*) {base_query}"
-                cursor.execute(count_query, params)
-                total_count = cursor.fetchone()[0]
-                
-                # Get paginated data
-                data_query = f"SELECT * {base_query} ORDER BY created_at DESC LIMIT ? OFFSET ?"
-                cursor.execute(data_query, params + [pagination.limit, pagination.offset])
-                rows = cursor.fetchall()
-                
-                # Process results
-                properties = []
-                for row in rows:
-                    prop = dict(row)
-                    # Parse raw_data if it exists
-                    if prop.get('raw_data'):
-                        try:
-                            prop['raw_data'] = json.loads(prop['raw_data'])
-                        except json.JSONDecodeError:
-                            pass
-                    properties.append(prop)
+                base_query = f"FROM properties {where_clause}"
+                raw_join = _raw_join('properties', selected, 'p')
+                
+                # Get total count, unless the caller opted out of it
+                total_count = None
+                if pagination.include_count:
+                    count_query = f"SELECT COUNT(*) {base_query}"
+                    cursor.execute(count_query, params)
+                    total_count = cursor.fetchone()[0]
+                
+                # Get paginated data; id breaks created_at ties so keyset
+                # pages neither skip nor repeat rows. One extra row tells
+                # whether another page follows without needing the count.
+                if pagination.cursor is not None:
+                    data_query = (f"SELECT {_select_columns(selected, 'p')} "
+                                  f"FROM properties p{raw_join} "
+                                  f"{where_clause} AND (created_at, id) < (?, ?) "
+                                  "ORDER BY created_at DESC, id DESC LIMIT ?")
+                    cursor.execute(data_query, params + [*pagination.cursor, pagination.limit + 1])
+                else:
+                    # Deferred join: skip the offset over ids alone (served by
+                    # the index), then read full rows only for this page
+                    data_query = (f"SELECT {_select_columns(selected, 'p')} "
+                                  "FROM properties p JOIN ("
+                                  f"SELECT id {base_query} "
+                                  "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+                                  f") page ON p.id = page.id{raw_join} "
+                                  "ORDER BY p.created_at DESC, p.id DESC")
+                    cursor.execute(data_query, params + [pagination.limit + 1, pagination.offset])
+                rows = _fetch_records(cursor)
+                has_more = len(rows) > pagination.limit
+                rows = rows[:pagination.limit]
                 
                 return PaginatedResult(
-                    data=properties,
+                    data=rows,
                     total_count=total_count,
                     limit=pagination.limit,
                     offset=pagination.offset,
-                    has_more=False  # Will be calculated in __post_init__
+                    has_more=has_more,
+                    cursor=pagination.cursor,
+                    next_cursor=(rows[-1]['created_at'], rows[-1]['id']) if rows else None
                 )
                 
         except Exception as e:
@@ -743,53 +1692,86 @@ class DatabaseManager:
                 total_count=0,
                 limit=pagination.limit,
                 offset=pagination.offset,
-                has_more=False
+                has_more=False,
+                cursor=pagination.cursor
             )
     
     def get_recent_properties_paginated(self, days: int = 7,
-                                       pagination: PaginationParams = PaginationParams()
-                                       ) -> PaginatedResult:
+                                       pagination: PaginationParams = PaginationParams(),
+                                       include_raw: bool = False,
+                                       columns: Optional[List[str]] = None) -> PaginatedResult:
         """
         Get recent properties with pagination support.
         
+        Properties are ordered newest fetch first by (fetched_at, id). As
+        with get_properties_paginated(), passing a result's ``next_cursor``
+        back as ``pagination.cursor`` seeks straight to the next page.
+        
         Args:
             days: Number of days to look back
-            pagination: Pagination parameters
+            pagination: Pagination parameters (limit, and offset or cursor);
+                with include_count False the COUNT(*) is skipped and
+                total_count is None
+            include_raw: Whether to read and decode each row's raw_data
+            columns: Columns to select (default: all but raw_data); id and
+                fetched_at are always included for the cursor
             
         Returns:
             PaginatedResult containing recent properties and pagination metadata
         """
+        selected = _project(columns, _PROPERTY_COLUMNS, include_raw, required=('id', 'fetched_at'))
+        
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                # Get total count
-                cursor.execute('''
-                    SELECT COUNT(*) FROM properties 
-                    WHERE fetched_at > ?
-                ''', (cutoff_date,))
-                total_count = cursor.fetchone()[0]
-                
-                # Get paginated data
-                cursor.execute('''
-                    SELECT * FROM properties 
-                    WHERE fetched_at > ? 
-                    ORDER BY fetched_at DESC
-                    LIMIT ? OFFSET ?
-                ''', (cutoff_date, pagination.limit, pagination.offset))
-                
-                rows = cursor.fetchall()
-                properties = [dict(row) for row in rows]
+                # Get total count, unless the caller opted out of it
+                total_count = None
+                if pagination.include_count:
+                    cursor.execute('''
+                        SELECT COUNT(*) FROM properties 
+                        WHERE fetched_at > ?
+                    ''', (cutoff_date,))
+                    total_count = cursor.fetchone()[0]
+                
+                raw_join = _raw_join('properties', selected, 'p')
+                
+                # Get paginated data, reading one extra row to tell whether
+                # another page follows
+                if pagination.cursor is not None:
+                    data_query = (f"SELECT {_select_columns(selected, 'p')} "
+                                  f"FROM properties p{raw_join} "
+                                  "WHERE p.fetched_at > ? AND (p.fetched_at, p.id) < (?, ?) "
+                                  "ORDER BY p.fetched_at DESC, p.id DESC LIMIT ?")
+                    cursor.execute(data_query,
+                                   (cutoff_date, *pagination.cursor, pagination.limit + 1))
+                else:
+                    # Skip the offset over ids alone (deferred join) before
+                    # reading full rows
+                    data_query = (f"SELECT {_select_columns(selected, 'p')} "
+                                  "FROM properties p JOIN ("
+                                  "SELECT id FROM properties WHERE fetched_at > ? "
+                                  "ORDER BY fetched_at DESC, id DESC LIMIT ? OFFSET ?"
+                                  f") page ON p.id = page.id{raw_join} "
+                                  "ORDER BY p.fetched_at DESC, p.id DESC")
+                    cursor.execute(data_query,
+                                   (cutoff_date, pagination.limit + 1, pagination.offset))
+                
+                properties = _fetch_records(cursor)
+                has_more = len(properties) > pagination.limit
+                properties = properties[:pagination.limit]
                 
                 return PaginatedResult(
                     data=properties,
                     total_count=total_count,
                     limit=pagination.limit,
                     offset=pagination.offset,
-                    has_more=False  # Will be calculated in __post_init__
+                    has_more=has_more,
+                    cursor=pagination.cursor,
+                    next_cursor=((properties[-1]['fetched_at'], properties[-1]['id'])
+                                 if properties else None)
                 )
                 
         except Exception as e:
@@ -799,7 +1781,8 @@ class DatabaseManager:
                 total_count=0,
                 limit=pagination.limit,
                 offset=pagination.offset,
-                has_more=False
+                has_more=False,
+                cursor=pagination.cursor
             )
     
     def _build_criteria_query(self, criteria: Dict[str, Any]) -> Tuple[str, List[Any]]:
@@ -812,84 +1795,33 @@ class DatabaseManager:
         Returns:
             Tuple of (query_string, parameters_list)
         """
-        query_parts = []
-        params = []
-        
-        # Price range
-        if 'price' in criteria:
-            price_criteria = criteria['price']
-            if 'min' in price_criteria:
-                query_parts.append("AND price >= ?")
-                params.append(price_criteria['min'])
-            if 'max' in price_criteria:
-                query_parts.append("AND price <= ?")
-                params.append(price_criteria['max'])
-        
-        # Bedrooms
-        if 'bedrooms' in criteria:
-            bed_criteria = criteria['bedrooms']
-            if 'min' in bed_criteria:
-                query_parts.append("AND bedrooms >= ?")
-                params.append(bed_criteria['min'])
-        
-        # Bathrooms
-        if 'bathrooms' in criteria:
-            bath_criteria = criteria['bathrooms']
-            if 'min' in bath_criteria:
-                query_parts.append("AND bathrooms >= ?")
-                params.append(bath_criteria['min'])
-        
-        # Square feet
-        if 'square_feet' in criteria:
-            sqft_criteria = criteria['square_feet']
-            if 'min' in sqft_criteria:
-                query_parts.append("AND square_feet >= ?")
-                params.append(sqft_criteria['min'])
-            if 'max' in sqft_criteria:
-                query_parts.append("AND square_feet <= ?")
-                params.append(sqft_criteria['max'])
-        
-        # Cities
-        if 'cities' in criteria and 'in' in criteria['cities']:
-            cities = criteria['cities']['in']
-            placeholders = ','.join(['?' for _ in cities])
-            query_parts.append(f"AND city IN ({placeholders})")
-            params.extend(cities)
-        
-        # Property type
-        if 'property_type' in criteria and 'in' in criteria['property_type']:
-            types = criteria['property_type']['in']
-            placeholders = ','.join(['?' for _ in types])
-            query_parts.append(f"AND property_type IN ({placeholders})")
-            params.extend(types)
-        
-        # Days on market
-        if 'days_on_market' in criteria:
-            dom_criteria = criteria['days_on_market']
-            if 'max' in dom_criteria:
-                query_parts.append("AND days_on_market <= ?")
-                params.append(dom_criteria['max'])
-        
-        return ' ' + ' '.join(query_parts), params
+        query, extract_params = _compile_criteria(_criteria_shape(criteria))
+        return query, extract_params(criteria)
     
     def get_city_statistics(self) -> List[Dict[str, Any]]:
-        """Get statistics grouped by city."""
+        """
+        Get statistics grouped by city.
+        
+        Reads the city_stats_mv rollup, rebuilding it first if a write to
+        properties has emptied it, so repeated calls don't rescan the table.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
+                if cursor.execute('SELECT 1 FROM city_stats_mv LIMIT 1').fetchone() is None:
+                    self._refresh_city_stats(cursor)
+                
                 cursor.execute('''
                     SELECT 
                         city,
-                        COUNT(*) as property_count,
-                        AVG(price) as avg_price,
-                        MIN(price) as min_price,
-                        MAX(price) as max_price,
-                        AVG(square_feet) as avg_sqft,
-                        AVG(days_on_market) as avg_days_on_market
-                    FROM properties 
-                    WHERE city IS NOT NULL AND city != ''
-                    GROUP BY city
+                        property_count,
+                        sum_price / NULLIF(n_price, 0) as avg_price,
+                        min_price,
+                        max_price,
+                        sum_sqft / NULLIF(n_sqft, 0) as avg_sqft,
+                        sum_dom / NULLIF(n_dom, 0) as avg_days_on_market
+                    FROM city_stats_mv
                     ORDER BY property_count DESC
                 ''')
                 
@@ -904,6 +1836,21 @@ class DatabaseManager:
             logger.error(f"Error getting city statistics: {str(e)}")
             return []
     
+    def refresh_city_statistics(self) -> None:
+        """Rebuild the city statistics rollup from the properties table."""
+        try:
+            with self._connect() as conn:
+                self._refresh_city_stats(conn.cursor())
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error refreshing city statistics: {str(e)}")
+    
+    @staticmethod
+    def _refresh_city_stats(cursor: sqlite3.Cursor) -> None:
+        """Rebuild city_stats_mv within the caller's transaction."""
+        cursor.execute('DELETE FROM city_stats_mv')
+        cursor.execute(_REFRESH_CITY_STATS_SQL, (datetime.now().isoformat(),))
+    
     def save_analysis_results(self, analysis_type: str, results: Dict[str, Any]) -> bool:
         """
         Save analysis results to the database.
@@ -916,13 +1863,10 @@ class DatabaseManager:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    INSERT INTO analysis_results (analysis_type, results)
-                    VALUES (?, ?)
-                ''', (analysis_type, json.dumps(results)))
+                cursor.execute(_INSERT_ANALYSIS_RESULT_SQL, (analysis_type, json.dumps(results)))
                 
                 conn.commit()
                 return True
@@ -944,7 +1888,7 @@ class DatabaseManager:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Extract key AVM metrics
@@ -980,14 +1924,7 @@ class DatabaseManager:
                     cash_flow = annual_rent - estimated_expenses
                     roi_percentage = (cash_flow / estimated_value) * 100
                 
-                cursor.execute('''
-                    INSERT OR REPLACE INTO avm_valuations 
-                    (property_id, address, estimated_value, estimated_rent, confidence_score,
-                     value_range_low, value_range_high, rent_range_low, rent_range_high,
-                     comparables_count, cap_rate, cash_flow, roi_percentage, raw_avm_data,
-                     fetched_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_INSERT_AVM_SQL, (
                     property_id, address, estimated_value, estimated_rent, confidence,
                     value_low, value_high, rent_low, rent_high, comparables_count,
                     cap_rate, cash_flow, roi_percentage, json.dumps(avm_data),
@@ -1014,25 +1951,23 @@ class DatabaseManager:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                # Extract market data by property type
+                # One row per property type and bedroom count; values shared
+                # by every row are computed once
+                now = datetime.now()
+                analysis_month = now.strftime('%Y-%m')
+                fetched_at = now.isoformat()
+                raw_market_data = json.dumps(market_data)
+                
+                rows = []
                 for property_type, type_data in market_data.get('propertyTypes', {}).items():
                     for bedroom_count, bedroom_data in type_data.get('bedrooms', {}).items():
                         sale_data = bedroom_data.get('saleData', {})
                         rental_data = bedroom_data.get('rentalData', {})
                         
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO market_statistics 
-                            (zip_code, city, state, property_type, bedrooms,
-                             avg_sale_price, median_sale_price, avg_rent_price, median_rent_price,
-                             avg_price_per_sqft, avg_rent_per_sqft, inventory_count, 
-                             avg_days_on_market, rent_yield_percentage, 
-                             price_trend_3m, price_trend_6m, price_trend_12m,
-                             raw_market_data, analysis_month, fetched_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
+                        rows.append((
                             zip_code,
                             market_data.get('city'),
                             market_data.get('state'),
@@ -1046,17 +1981,17 @@ class DatabaseManager:
                             rental_data.get('averagePricePerSquareFoot'),
                             sale_data.get('inventoryCount'),
                             sale_data.get('averageDaysOnMarket'),
-                            # Calculate rent yield if we have both sale and rental prices
-                            (((rental_data.get('averagePrice', 0) * 12) /
-                              sale_data.get('averagePrice', 1) * 100)
-                             if sale_data.get('averagePrice') else None),
+                            # Rent yield is computed by the INSERT
                             # Price trends (would need historical data)
                             None, None, None,
-                            json.dumps(market_data),
-                            datetime.now().strftime('%Y-%m'),
-                            datetime.now().isoformat()
+                            raw_market_data,
+                            analysis_month,
+                            fetched_at
                         ))
                 
+                conn.execute('BEGIN IMMEDIATE')
+                cursor.executemany(_INSERT_MARKET_STATISTICS_SQL, rows)
+                
                 conn.commit()
                 logger.info(f"Saved market statistics for ZIP {zip_code}")
                 return True
@@ -1078,32 +2013,29 @@ class DatabaseManager:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                for comp in comparables:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO property_comparables 
-                        (source_property_id, comparable_property_id, comparable_address,
-                         sale_price, sale_date, distance_miles, bedrooms, bathrooms,
-                         square_feet, price_per_sqft, days_on_market, similarity_score,
-                         raw_comparable_data)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        source_property_id,
-                        comp.get('id'),
-                        comp.get('address'),
-                        comp.get('price'),
-                        comp.get('saleDate'),
-                        comp.get('distance'),
-                        comp.get('bedrooms'),
-                        comp.get('bathrooms'),
-                        comp.get('squareFootage'),
-                        comp.get('pricePerSquareFoot'),
-                        comp.get('daysOnMarket'),
-                        comp.get('similarityScore', 0.8),  # Default similarity
-                        json.dumps(comp)
-                    ))
+                rows = [(
+                    source_property_id,
+                    comp.get('id'),
+                    comp.get('address'),
+                    comp.get('price'),
+                    comp.get('saleDate'),
+                    comp.get('distance'),
+                    comp.get('bedrooms'),
+                    comp.get('bathrooms'),
+                    comp.get('squareFootage'),
+                    comp.get('pricePerSquareFoot'),
+                    comp.get('daysOnMarket'),
+                    comp.get('similarityScore', 0.8),  # Default similarity
+                    json.dumps(comp)
+                ) for comp in comparables]
+                
+                # All comparables go in through one prepared statement
+                # and one transaction
+                conn.execute('BEGIN IMMEDIATE')
+                cursor.executemany(_INSERT_COMPARABLE_SQL, rows)
                 
                 conn.commit()
                 logger.info(f"Saved {len(comparables)} comparables "
@@ -1126,17 +2058,10 @@ class DatabaseManager:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    INSERT OR REPLACE INTO investment_analysis 
-                    (property_id, purchase_price, estimated_rent, estimated_expenses,
-                     cap_rate, cash_on_cash_return, gross_yield, net_yield,
-                     monthly_cash_flow, annual_cash_flow, break_even_ratio,
-                     investment_score, risk_level, analysis_notes, analysis_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_INSERT_INVESTMENT_SQL, (
                     property_id,
                     investment_data.get('purchase_price'),
                     investment_data.get('estimated_rent'),
@@ -1179,14 +2104,11 @@ class DatabaseManager:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    INSERT INTO price_history 
-                    (property_id, price, price_type, date_recorded, source, notes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (property_id, price, price_type, date_recorded, source, notes))
+                cursor.execute(_INSERT_PRICE_HISTORY_SQL,
+                               (property_id, price, price_type, date_recorded, source, notes))
                 
                 conn.commit()
                 return True
@@ -1211,14 +2133,11 @@ class DatabaseManager:
             True if logged successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    INSERT INTO notifications_log 
-                    (notification_type, recipient, subject, status, property_count)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (notification_type, recipient, subject, status, property_count))
+                cursor.execute(_INSERT_NOTIFICATION_SQL,
+                               (notification_type, recipient, subject, status, property_count))
                 
                 conn.commit()
                 return True
@@ -1230,68 +2149,64 @@ class DatabaseManager:
     def get_database_stats(self) -> Dict[str, Any]:
         """Get comprehensive database statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 stats = {}
                 
-                # Get table counts
-                tables = [
-                    'properties', 'analysis_results', 'notifications_log',
-                    'avm_valuations', 'market_statistics', 'property_comparables',
-                    'investment_analysis', 'price_history', 'deal_analyses', 'deal_insights'
+                # Learn which tables exist once instead of probing each one
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                existing = {row[0] for row in cursor.fetchall()}
+                
+                # Table counts, the good-investment count and the date ranges
+                # are all scalar subqueries, so one statement returns them all
+                count_tables = [table for table in _STATS_TABLES if table in existing]
+                range_tables = [table for table in _STATS_DATE_COLUMNS if table in existing]
+                # Tables with a maintained counter are read from row_counts
+                columns = [
+                    f"(SELECT n FROM row_counts WHERE table_name = '{table}')"
+                    if table in _COUNTED_TABLES and 'row_counts' in existing
+                    else f"(SELECT COUNT(*) FROM {table})"
+                    for table in count_tables
                 ]
-                
-                for table in tables:
-                    try:
-                        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                        count = cursor.fetchone()[0]
-                        stats[f'{table}_count'] = count
-                    except sqlite3.OperationalError:
-                        # Table doesn't exist
-                        stats[f'{table}_count'] = 0
-                
-                # Get date ranges for main tables
-                for table in ['properties', 'avm_valuations', 'market_statistics']:
-                    try:
-                        date_column = ('created_at' if table == 'properties'
-                                      else 'fetched_at')
-                        cursor.execute(f"SELECT MIN({date_column}), "
-                                      f"MAX({date_column}) FROM {table}")
-                        date_range = cursor.fetchone()
+                for table in range_tables:
+                    date_column = _STATS_DATE_COLUMNS[table]
+                    columns.append(f"(SELECT MIN({date_column}) FROM {table})")
+                    columns.append(f"(SELECT MAX({date_column}) FROM {table})")
+                if 'investment_analysis' in existing:
+                    columns.append('''(SELECT COUNT(*) FROM investment_analysis
+                        WHERE cap_rate >= 8.0 AND monthly_cash_flow >= 200)''')
+                
+                values = []
+                if columns:
+                    cursor.execute(f"SELECT {', '.join(columns)}")
+                    values = list(cursor.fetchone())
+                
+                for table in _STATS_TABLES:
+                    stats[f'{table}_count'] = values.pop(0) if table in existing else 0
+                for table in _STATS_DATE_COLUMNS:
+                    if table in existing:
                         stats[f'{table}_date_range'] = {
-                            'earliest': date_range[0],
-                            'latest': date_range[1]
+                            'earliest': values.pop(0),
+                            'latest': values.pop(0)
                         }
-                    except sqlite3.OperationalError:
+                    else:
                         stats[f'{table}_date_range'] = {'earliest': None, 'latest': None}
+                stats['good_investment_count'] = (
+                    values.pop(0) if 'investment_analysis' in existing else 0)
+
                 
                 # Get unique sources
-                try:
+                stats['data_sources'] = []
+                if 'properties' in existing:
                     cursor.execute("SELECT DISTINCT source FROM properties")
-                    sources = [row[0] for row in cursor.fetchall()]
-                    stats['data_sources'] = sources
-                except sqlite3.OperationalError:
-                    stats['data_sources'] = []
+                    stats['data_sources'] = [row[0] for row in cursor.fetchall()]
                 
                 # Get unique ZIP codes from market data
-                try:
+                stats['market_zip_codes'] = []
+                if 'market_statistics' in existing:
                     cursor.execute("SELECT DISTINCT zip_code FROM market_statistics")
-                    zip_codes = [row[0] for row in cursor.fetchall()]
-                    stats['market_zip_codes'] = zip_codes
-                except sqlite3.OperationalError:
-                    stats['market_zip_codes'] = []
-                
-                # Get top investment properties
-                try:
-                    cursor.execute('''
-                        SELECT COUNT(*) FROM investment_analysis 
-                        WHERE cap_rate >= 8.0 AND monthly_cash_flow >= 200
-                    ''')
-                    good_investments = cursor.fetchone()[0]
-                    stats['good_investment_count'] = good_investments
-                except sqlite3.OperationalError:
-                    stats['good_investment_count'] = 0
+                    stats['market_zip_codes'] = [row[0] for row in cursor.fetchall()]
                 
                 # Database file size
                 stats['database_size_mb'] = (
@@ -1318,7 +2233,7 @@ class DatabaseManager:
         try:
             cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Delete old properties
@@ -1338,6 +2253,13 @@ class DatabaseManager:
                 total_deleted = deleted_properties + deleted_analysis + deleted_notifications
                 logger.info(f"Cleaned up {total_deleted} old records from database")
                 
+                # Refresh the planner's statistics after a large delete so
+                # it keeps choosing the composite indexes; analysis_limit
+                # bounds the rows sampled per index
+                if total_deleted:
+                    cursor.execute('PRAGMA analysis_limit = 1000')
+                    cursor.execute('ANALYZE')
+                
                 return total_deleted
                 
         except Exception as e:
@@ -1346,30 +2268,26 @@ class DatabaseManager:
     
     # New retrieval methods for analysis data
     
-    def get_avm_valuation(self, property_id: str) -> Optional[Dict[str, Any]]:
-        """Get AVM valuation data for a specific property."""
+    def get_avm_valuation(self, property_id: str,
+                          include_raw: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get AVM valuation data for a specific property.
+        
+        Args:
+            property_id: Property identifier
+            include_raw: Whether to read and decode raw_avm_data
+            
+        Returns:
+            Latest valuation dictionary, or None if there is none
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM avm_valuations 
-                    WHERE property_id = ? 
-                    ORDER BY fetched_at DESC LIMIT 1
-                ''', (property_id,))
+                cursor.execute(_SELECT_AVM_SQL[include_raw], (property_id,))
                 
-                row = cursor.fetchone()
-                if row:
-                    result = dict(row)
-                    # Parse raw_avm_data if it exists
-                    if result.get('raw_avm_data'):
-                        try:
-                            result['raw_avm_data'] = json.loads(result['raw_avm_data'])
-                        except json.JSONDecodeError:
-                            pass
-                    return result
-                return None
+                records = _fetch_records(cursor, 'raw_avm_data')
+                return records[0] if records else None
                 
         except Exception as e:
             logger.error(f"Error getting AVM valuation: {str(e)}")
@@ -1377,14 +2295,25 @@ class DatabaseManager:
     
     def get_market_statistics(self, zip_code: str,
                              property_type: Optional[str] = None,
-                             bedrooms: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get market statistics for a specific area."""
+                             bedrooms: Optional[int] = None,
+                             include_raw: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get market statistics for a specific area.
+        
+        Args:
+            zip_code: ZIP code
+            property_type: Optional property type filter
+            bedrooms: Optional bedroom count filter
+            include_raw: Whether to read and decode raw_market_data
+            
+        Returns:
+            List of market statistics dictionaries, newest month first
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                query = "SELECT * FROM market_statistics WHERE zip_code = ?"
+                query = _SELECT_MARKET_SQL[include_raw]
                 params = [zip_code]
                 
                 if property_type:
@@ -1398,53 +2327,33 @@ class DatabaseManager:
                 query += " ORDER BY analysis_month DESC"
                 
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
-                
-                results = []
-                for row in rows:
-                    result = dict(row)
-                    # Parse raw_market_data if it exists
-                    if result.get('raw_market_data'):
-                        try:
-                            result['raw_market_data'] = json.loads(result['raw_market_data'])
-                        except json.JSONDecodeError:
-                            pass
-                    results.append(result)
                 
-                return results
+                return _fetch_records(cursor, 'raw_market_data')
                 
         except Exception as e:
             logger.error(f"Error getting market statistics: {str(e)}")
             return []
     
-    def get_property_comparables(self, property_id: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get comparable properties for a specific property."""
+    def get_property_comparables(self, property_id: str, limit: int = 10,
+                                 include_raw: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get comparable properties for a specific property.
+        
+        Args:
+            property_id: Source property identifier
+            limit: Maximum number of comparables, most similar first
+            include_raw: Whether to read and decode raw_comparable_data
+            
+        Returns:
+            List of comparable dictionaries
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM property_comparables 
-                    WHERE source_property_id = ? 
-                    ORDER BY similarity_score DESC LIMIT ?
-                ''', (property_id, limit))
-                
-                rows = cursor.fetchall()
-                
-                results = []
-                for row in rows:
-                    result = dict(row)
-                    # Parse raw_comparable_data if it exists
-                    if result.get('raw_comparable_data'):
-                        try:
-                            result['raw_comparable_data'] = json.loads(
-                                result['raw_comparable_data'])
-                        except json.JSONDecodeError:
-                            pass
-                    results.append(result)
+                cursor.execute(_SELECT_COMPARABLES_SQL[include_raw], (property_id, limit))
                 
-                return results
+                return _fetch_records(cursor, 'raw_comparable_data')
                 
         except Exception as e:
             logger.error(f"Error getting property comparables: {str(e)}")
@@ -1453,15 +2362,11 @@ class DatabaseManager:
     def get_investment_analysis(self, property_id: str) -> Optional[Dict[str, Any]]:
         """Get investment analysis for a specific property."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM investment_analysis 
-                    WHERE property_id = ? 
-                    ORDER BY analysis_date DESC LIMIT 1
-                ''', (property_id,))
+                cursor.execute(_SELECT_INVESTMENT_SQL, (property_id,))
                 
                 row = cursor.fetchone()
                 return dict(row) if row else None
@@ -1473,15 +2378,11 @@ class DatabaseManager:
     def get_price_history(self, property_id: str) -> List[Dict[str, Any]]:
         """Get price history for a specific property."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT * FROM price_history 
-                    WHERE property_id = ? 
-                    ORDER BY date_recorded DESC
-                ''', (property_id,))
+                cursor.execute(_SELECT_PRICE_HISTORY_SQL, (property_id,))
                 
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -1495,20 +2396,11 @@ class DatabaseManager:
                                        limit: int = 20) -> List[Dict[str, Any]]:
         """Get top investment opportunities based on financial metrics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT ia.*, p.address, p.city, p.state, p.price, p.bedrooms, p.bathrooms,
-                           av.estimated_value, av.confidence_score
-                    FROM investment_analysis ia
-                    JOIN properties p ON ia.property_id = p.property_id
-                    LEFT JOIN avm_valuations av ON ia.property_id = av.property_id
-                    WHERE ia.cap_rate >= ? AND ia.monthly_cash_flow >= ?
-                    ORDER BY ia.investment_score DESC, ia.cap_rate DESC
-                    LIMIT ?
-                ''', (min_cap_rate, min_cash_flow, limit))
+                cursor.execute(_SELECT_TOP_INVESTMENTS_SQL, (min_cap_rate, min_cash_flow, limit))
                 
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -1520,7 +2412,7 @@ class DatabaseManager:
     def get_market_trends(self, zip_code: str, months_back: int = 12) -> Dict[str, Any]:
         """Get market trends for a specific area over time."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -1573,8 +2465,19 @@ class DatabaseManager:
             logger.error(f"Error getting market trends: {str(e)}")
             return {}
     
-    def _prepare_property_data(self, prop: Dict[str, Any]) -> Tuple:
-        """Prepare property data for database insertion."""
+    def _prepare_property_data(self, prop: Dict[str, Any], now: Optional[str] = None) -> Tuple:
+        """
+        Prepare property data for database insertion.
+        
+        Args:
+            prop: Property dictionary
+            now: ISO timestamp shared by the batch (default: current time)
+            
+        Returns:
+            Tuple of column values
+        """
+        if now is None:
+            now = datetime.now().isoformat()
         return (
             prop.get('property_id', ''),
             prop.get('source', ''),
@@ -1595,13 +2498,24 @@ class DatabaseManager:
             prop.get('latitude'),
             prop.get('longitude'),
             prop.get('description', ''),
-            json.dumps(prop) if isinstance(prop, dict) else '',
-            prop.get('fetched_at', datetime.now().isoformat()),
-            datetime.now().isoformat()
+            prop.get('fetched_at', now),
+            now
         )
     
-    def _prepare_listing_data(self, listing: Dict[str, Any]) -> Tuple:
-        """Prepare listing data for database insertion."""
+    def _prepare_listing_data(self, listing: Dict[str, Any], now: Optional[str] = None) -> Tuple:
+        """
+        Prepare listing data for database insertion.
+        
+        Args:
+            listing: Listing dictionary
+            now: ISO timestamp shared by the batch (default: current time)
+            
+        Returns:
+            Tuple of column values
+        """
+        if now is None:
+            now = datetime.now().isoformat()
+        
         # Determine listing type based on source and data
         listing_type = 'sale'  # Default
         if 'rental' in listing.get('source', '').lower() or listing.get('rental_type'):
@@ -1630,19 +2544,89 @@ class DatabaseManager:
             listing.get('latitude'),
             listing.get('longitude'),
             listing.get('description', ''),
-            json.dumps(listing) if isinstance(listing, dict) else '',
-            listing.get('fetched_at', datetime.now().isoformat()),
-            datetime.now().isoformat()
+            listing.get('fetched_at', now),
+            now,
+            listing.get('mls_number', listing.get('mlsNumber'))
         )
     
+    def _open_analytics_session(self) -> Optional[Any]:
+        """
+        Open an in-memory DuckDB session with this database attached read-only.
+        
+        Needs duckdb and its sqlite extension, which is installed once at
+        setup time (setup.py, or ``duckdb.execute('INSTALL sqlite')``) and
+        only loaded here, so queries never reach out to the network.
+        
+        Returns:
+            DuckDB connection, or None if duckdb or the extension is unavailable
+        """
+        try:
+            import duckdb
+        except ImportError:
+            return None
+        
+        analytics = None
+        try:
+            analytics = duckdb.connect()
+            analytics.execute('LOAD sqlite')
+            db_path = str(self.db_path).replace("'", "''")
+            analytics.execute(f"ATTACH '{db_path}' AS real_estate (TYPE SQLITE, READ_ONLY)")
+            analytics.execute('USE real_estate')
+            return analytics
+        except Exception as e:
+            logger.warning(f"DuckDB unavailable for analytics, using SQLite: {str(e)}")
+            if analytics is not None:
+                analytics.close()
+            return None
+    
+    def analytics_query(self, sql: str, params: Optional[List[Any]] = None) -> 'pd.DataFrame':
+        """
+        Run a read-only analytical query and return the result as a DataFrame.
+        
+        When duckdb and its sqlite extension are installed, the database
+        file is attached read-only to an in-memory DuckDB session and the
+        query runs on its columnar, vectorized engine, which is much faster
+        for scans and aggregations over many rows. Otherwise, or if the
+        session cannot be set up, the query runs on SQLite and is read
+        into pandas directly. Either way no per-row dicts are built; stick
+        to SQL both engines accept (plain SELECTs and aggregates).
+        
+        Args:
+            sql: SELECT statement over this database's tables
+            params: Optional bind values for ``?`` placeholders
+            
+        Returns:
+            DataFrame with the query result (empty if the query fails)
+        """
+        import pandas as pd
+        
+        analytics = self._open_analytics_session()
+        
+        try:
+            if analytics is not None:
+                try:
+                    return analytics.execute(sql, params or []).df()
+                finally:
+                    analytics.close()
+            
+            with self._connect() as conn:
+                return pd.read_sql_query(sql, conn, params=params)
+                
+        except Exception as e:
+            logger.error(f"Error running analytics query: {str(e)}")
+            return pd.DataFrame()
+    
     def close(self) -> None:
         """Close database connections."""
-        # For SQLite, connections are closed automatically when using context manager
-        pass
+        with self._conn_lock:
+            for holder in list(self._connections):
+                holder.conn.close()
+            self._connections.clear()
+            self._local = threading.local()
     
     def create_deal_analysis_tables(self):
         """Create tables for deal analysis pipeline."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Main deal analyses table
@@ -1709,16 +2693,11 @@ class DatabaseManager:
                            deal_score_data: Dict[str, Any],
                            analysis_timestamp: datetime):
         """Store complete deal analysis results."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Store in main analyses table
-            cursor.execute('''
-                INSERT OR REPLACE INTO deal_analyses 
-                (analysis_id, property_address, property_data, avm_data, 
-                 market_data, deal_score_data, analysis_timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            cursor.execute(_INSERT_DEAL_ANALYSIS_SQL, (
                 analysis_id, property_data.get('formattedAddress', ''),
                 json.dumps(property_data),
                 json.dumps(avm_data) if avm_data else None,
@@ -1728,13 +2707,7 @@ class DatabaseManager:
             ))
             
             # Store in insights summary table
-            cursor.execute('''
-                INSERT OR REPLACE INTO deal_insights 
-                (analysis_id, property_address, zip_code, property_type, bedrooms, bathrooms, 
-                 square_footage, asking_price, estimated_value, overall_score, deal_type, 
-                 confidence, value_discount_pct, analysis_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            cursor.execute(_INSERT_DEAL_INSIGHT_SQL, (
                 analysis_id, property_data.get('formattedAddress', ''),
                 property_data.get('zipCode'),
                 property_data.get('propertyType'), property_data.get('bedrooms'),
@@ -1752,7 +2725,7 @@ class DatabaseManager:
                       min_score: float = 70.0,
                       limit: int = 20) -> List[Dict[str, Any]]:
         """Get the best deals from recent analyses."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
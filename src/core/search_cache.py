@@ -0,0 +1,183 @@
+"""
+Search Cache Module
+
+This module provides a persistent cache for structured RentCast search results.
+Entries are stored in a small SQLite database with a per-entry expiry, so repeated
+searches for the same criteria skip the API even across process restarts.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library codec
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCache:
+    """SQLite-backed cache of search results with per-entry time-to-live."""
+    
+    def __init__(self, path: Union[str, Path], default_ttl: float = 86400):
+        """
+        Initialize the search cache.
+        
+        Args:
+            path: Path to the SQLite cache file (parent directories are created)
+            default_ttl: Default entry lifetime in seconds (default: 24 hours)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        
+        # One connection shared across threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # Same tuning as the main database: WAL lets other processes read
+        # the cache while one writes, and NORMAL sync is safe under WAL
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+        self._conn.execute('PRAGMA temp_store = MEMORY')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS search_cache (
+                cache_key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+        
+        logger.info(f"Search cache opened at {self.path}")
+    
+    @staticmethod
+    def make_key(kind: str, search_criteria: Any) -> str:
+        """
+        Build a stable cache key for a search.
+        
+        The key covers the criteria type and the exact query parameters sent
+        to the API, so equal searches share an entry regardless of how the
+        criteria object was built.
+        
+        Args:
+            kind: Endpoint or result kind (e.g. 'properties', 'listings_sale')
+            search_criteria: SearchCriteria instance
+        
+        Returns:
+            Hex digest identifying the search
+        """
+        payload = {
+            'kind': kind,
+            'criteria': type(search_criteria).__name__,
+            'params': search_criteria.to_query_params(),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a cached result.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT value, expires_at FROM search_cache WHERE cache_key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                value, expires_at = row
+                if expires_at <= time.time():
+                    self._conn.execute('DELETE FROM search_cache WHERE cache_key = ?', (key,))
+                    self._conn.commit()
+                    return None
+            
+            if orjson is not None:
+                return orjson.loads(value)
+            return json.loads(value)
+        
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Error reading search cache: {str(e)}")
+            return None
+    
+    def set(self, key: str, value: List[Dict[str, Any]], ttl: Optional[float] = None) -> None:
+        """
+        Store a result.
+        
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable search result
+            ttl: Entry lifetime in seconds (default: the cache's default_ttl)
+        """
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        try:
+            if orjson is not None:
+                encoded = orjson.dumps(value, default=str).decode('utf-8')
+            else:
+                encoded = json.dumps(value, default=str)
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO search_cache (cache_key, value, expires_at) VALUES (?, ?, ?)',
+                    (key, encoded, expires_at)
+                )
+                self._conn.commit()
+        
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Error writing search cache: {str(e)}")
+    
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry.
+        
+        Args:
+            key: Cache key from make_key()
+        """
+        try:
+            with self._lock:
+                self._conn.execute('DELETE FROM search_cache WHERE cache_key = ?', (key,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error deleting search cache entry: {str(e)}")
+    
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock:
+                cursor = self._conn.execute('DELETE FROM search_cache WHERE expires_at <= ?', (time.time(),))
+                self._conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Error purging search cache: {str(e)}")
+            return 0
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        try:
+            with self._lock:
+                self._conn.execute('DELETE FROM search_cache')
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error clearing search cache: {str(e)}")
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -471,6 +471,8 @@ class PropertiesResponse:
     total_count: Optional[int] = None
     has_more: Optional[bool] = None
     next_offset: Optional[int] = None
+    # Source record dicts as returned by the API, parallel to ``properties``
+    raw: List[Dict[str, Any]] = field(default_factory=list, repr=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PropertiesResponse':
@@ -484,26 +486,26 @@ class PropertiesResponse:
             PropertiesResponse instance
         """
         properties = []
+        raw = []
         
         # Handle different response formats
         if 'properties' in data:
             # Standard properties list response
             properties_data = data.get('properties', [])
             if isinstance(properties_data, list):
-                for prop_data in properties_data:
-                    if isinstance(prop_data, dict):
-                        properties.append(Property.from_dict(prop_data))
+                raw = [prop_data for prop_data in properties_data if isinstance(prop_data, dict)]
         elif isinstance(data, list):
             # Direct list of properties
-            for prop_data in data:
-                if isinstance(prop_data, dict):
-                    properties.append(Property.from_dict(prop_data))
+            raw = [prop_data for prop_data in data if isinstance(prop_data, dict)]
         elif isinstance(data, dict) and 'id' in data:
             # Single property response (like /properties/{id})
-            properties.append(Property.from_dict(data))
+            raw = [data]
+        
+        properties = [Property.from_dict(prop_data) for prop_data in raw]
         
         return cls(
             properties=properties,
+            raw=raw,
             total_count=data.get('totalCount') if isinstance(data, dict) else None,
             has_more=data.get('hasMore') if isinstance(data, dict) else None,
             next_offset=data.get('nextOffset') if isinstance(data, dict) else None
@@ -1106,31 +1108,32 @@ class ListingsResponse:
     total_count: Optional[int] = None
     has_more: Optional[bool] = None
     next_offset: Optional[int] = None
+    # Source record dicts as returned by the API, parallel to ``listings``
+    raw: List[Dict[str, Any]] = field(default_factory=list, repr=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ListingsResponse':
         """Create ListingsResponse from API response dictionary."""
-        listings = []
+        raw = []
         
         # Handle different response formats
         if 'listings' in data:
             # Standard listings response
             listings_data = data.get('listings', [])
             if isinstance(listings_data, list):
-                for listing_data in listings_data:
-                    if isinstance(listing_data, dict):
-                        listings.append(PropertyListing.from_dict(listing_data))
+                raw = [listing_data for listing_data in listings_data if isinstance(listing_data, dict)]
         elif isinstance(data, list):
             # Direct list of listings
-            for listing_data in data:
-                if isinstance(listing_data, dict):
-                    listings.append(PropertyListing.from_dict(listing_data))
+            raw = [listing_data for listing_data in data if isinstance(listing_data, dict)]
         elif isinstance(data, dict) and 'id' in data:
             # Single listing response
-            listings.append(PropertyListing.from_dict(data))
+            raw = [data]
+        
+        listings = [PropertyListing.from_dict(listing_data) for listing_data in raw]
         
         return cls(
             listings=listings,
+            raw=raw,
             total_count=data.get('totalCount') if isinstance(data, dict) else None,
             has_more=data.get('hasMore') if isinstance(data, dict) else None,
             next_offset=data.get('nextOffset') if isinstance(data, dict) else None
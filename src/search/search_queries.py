@@ -67,6 +67,9 @@ class SearchCriteria:
     limit: Optional[int] = None
     offset: Optional[int] = None
     
+    # Set by each concrete search class
+    search_type: Optional[SearchType] = field(default=None, init=False)
+    
     def to_query_params(self) -> Dict[str, Any]:
         """Convert search criteria to API query parameters."""
         params = {}